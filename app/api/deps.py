@@ -1,9 +1,37 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Optional
 
 from fastapi import Depends
 
 from app.core.config import AppSettings, get_settings
+from app.infrastructure.google_calendar_holiday_provider import (
+    GoogleCalendarHolidayProvider,
+    YearHolidayCache,
+)
 
 
 SettingsDep = Annotated[AppSettings, Depends(get_settings)]
 
+
+@lru_cache
+def get_year_holiday_cache() -> YearHolidayCache:
+    """프로세스 전체에서 공유하는 연도별 공휴일 메모리 캐시"""
+    return YearHolidayCache()
+
+
+def holidays_enabled(settings: AppSettings) -> bool:
+    """공휴일을 사용할 수 있는지 (API Key 또는 공휴일 번들이 설정된 경우)"""
+    return bool(settings.google_cal_api_key or settings.holiday_bundle_path)
+
+
+def get_holiday_provider(settings: AppSettings) -> Optional[GoogleCalendarHolidayProvider]:
+    """
+    요청마다 새 공휴일 제공자를 반환합니다 (API Key와 공휴일 번들이 모두 없으면 None).
+
+    Google API 클라이언트는 스레드 안전하지 않으므로 요청마다 따로 만들고,
+    연도별 메모리 캐시만 프로세스 전체에서 공유합니다 (공휴일 번들도 이 캐시에 적재됨).
+    API Key 없이 번들만 설정되면 외부 API를 호출하지 않는 캐시 전용 제공자를 반환합니다.
+    """
+    if not holidays_enabled(settings):
+        return None
+    return GoogleCalendarHolidayProvider(settings.google_cal_api_key, memory_cache=get_year_holiday_cache())
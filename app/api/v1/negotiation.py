@@ -0,0 +1,145 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Accept 헤더에서 허용하는 미디어 타입 별칭 -> 정규 미디어 타입
+SUPPORTED_MEDIA_TYPES = {
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE: MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    ARROW_STREAM_MEDIA_TYPE: ARROW_STREAM_MEDIA_TYPE,
+}
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Accept 헤더를 해석하여 응답 미디어 타입을 결정합니다.
+
+    Args:
+        accept: Accept 헤더 값 (없으면 JSON)
+
+    Returns:
+        지원하는 미디어 타입 중 품질값(q)이 가장 높은 타입
+
+    Raises:
+        HTTPException: 지원하는 미디어 타입이 하나도 없는 경우 (406)
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    best_type: Optional[str] = None
+    best_quality = 0.0
+    for part in accept.split(","):
+        media_range, *params = [token.strip() for token in part.split(";")]
+        media_range = media_range.lower()
+
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if media_range in ("*/*", "application/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            candidate = SUPPORTED_MEDIA_TYPES.get(media_range)
+
+        # 품질값이 같으면 먼저 나온 타입을 우선
+        if candidate is not None and quality > best_quality:
+            best_type = candidate
+            best_quality = quality
+
+    if best_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Supported media types: {', '.join(SUPPORTED_MEDIA_TYPES)}",
+        )
+    return best_type
+
+
+def _encode_msgpack(payload: object) -> bytes:
+    """MessagePack으로 직렬화합니다."""
+    import msgpack
+
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def _encode_arrow_stream(records: list[BaseModel]) -> bytes:
+    """
+    계산 결과를 Arrow IPC 스트림(단일 레코드 배치)으로 직렬화합니다.
+
+    날짜는 date32, 제외 목록은 list<date32> (오프셋 인코딩)로 저장하여
+    클라이언트가 행 단위 디코딩 없이 바로 데이터프레임으로 읽을 수 있도록 합니다.
+    """
+    import pyarrow as pa
+
+    rows = [record.model_dump() for record in records]
+
+    def to_dates(values: list[str]) -> list[date]:
+        return [date.fromisoformat(value) for value in values]
+
+    schema = pa.schema([
+        ("delivery_date", pa.date32()),
+        ("due_date", pa.date32()),
+        ("term_kind", pa.string()),
+        ("days", pa.int32()),
+        ("country_codes", pa.list_(pa.string())),
+        ("excluded_weekend_count", pa.int32()),
+        ("excluded_holiday_count", pa.int32()),
+        ("excluded_weekends", pa.list_(pa.date32())),
+        ("excluded_holidays", pa.list_(pa.date32())),
+        ("holidays_excluded", pa.bool_()),
+    ])
+    batch = pa.record_batch(
+        [
+            pa.array([date.fromisoformat(row["delivery_date"]) for row in rows], pa.date32()),
+            pa.array([date.fromisoformat(row["due_date"]) for row in rows], pa.date32()),
+            pa.array([row["term_kind"] for row in rows], pa.string()),
+            pa.array([row["days"] for row in rows], pa.int32()),
+            pa.array([row["country_codes"] for row in rows], pa.list_(pa.string())),
+            pa.array([len(row["excluded_weekends"]) for row in rows], pa.int32()),
+            pa.array([len(row["excluded_holidays"]) for row in rows], pa.int32()),
+            pa.array([to_dates(row["excluded_weekends"]) for row in rows], pa.list_(pa.date32())),
+            pa.array([to_dates(row["excluded_holidays"]) for row in rows], pa.list_(pa.date32())),
+            pa.array([row["holidays_excluded"] for row in rows], pa.bool_()),
+        ],
+        schema=schema,
+    )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def render_records(records: list[BaseModel], media_type: str, single: bool = False) -> Response:
+    """
+    협상된 미디어 타입으로 계산 결과를 응답합니다.
+
+    Args:
+        records: 응답 모델 목록
+        media_type: negotiate_media_type()으로 결정된 미디어 타입
+        single: 단건 엔드포인트 여부 (JSON/MessagePack에서 목록 대신 단일 객체로 응답)
+
+    Returns:
+        직렬화된 응답
+    """
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        # Arrow는 항상 컬럼 배치로 응답 (단건이면 1행)
+        return Response(content=_encode_arrow_stream(records), media_type=media_type)
+
+    payload = records[0].model_dump() if single else [record.model_dump() for record in records]
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return Response(content=_encode_msgpack(payload), media_type=media_type)
+    return JSONResponse(content=payload)
@@ -0,0 +1,61 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from app.api.deps import get_holiday_provider
+from app.core.config import AppSettings, get_settings
+from app.infrastructure.holiday_bundle import HolidayBundleError, read_bundle
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+class BundleImportResponse(BaseModel):
+    """공휴일 번들 적재 결과"""
+    imported: int  # 적재한 (국가, 연도) 수
+
+
+def _require_admin(
+    settings: AppSettings = Depends(get_settings),
+    x_admin_token: Optional[str] = Header(None),
+) -> None:
+    """관리자 토큰을 확인합니다. 토큰이 설정되지 않은 경우 관리자 API는 비활성화됩니다."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post(
+    "/holiday-bundle",
+    response_model=BundleImportResponse,
+    dependencies=[Depends(_require_admin)],
+)
+def import_holiday_bundle(
+    bundle: bytes = Body(..., media_type="application/octet-stream", description="번들 파일 내용"),
+    settings: AppSettings = Depends(get_settings),
+) -> BundleImportResponse:
+    """
+    공휴일 번들 파일(요청 본문)을 검증하여 공휴일 제공자의 메모리/파일 캐시에 적재합니다.
+
+    압축 해제와 파일 캐시 쓰기는 블로킹 작업이므로 일반 함수로 두어 스레드풀에서 실행합니다.
+
+    Args:
+        bundle: 번들 파일 내용 (요청 본문)
+        settings: 앱 설정
+
+    Returns:
+        적재한 (국가, 연도) 수
+    """
+    holiday_provider = get_holiday_provider(settings)
+    if holiday_provider is None:
+        raise HTTPException(status_code=409, detail="Holiday provider is not configured")
+
+    try:
+        holidays = read_bundle(bundle)
+    except HolidayBundleError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return BundleImportResponse(imported=holiday_provider.seed_holidays(holidays))
@@ -1,30 +1,42 @@
+from dataclasses import asdict
 from datetime import date
-from typing import Optional
+from itertools import product
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from app.api.deps import get_holiday_provider, holidays_enabled
+from app.api.v1.negotiation import (
+    ARROW_STREAM_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate_media_type,
+    render_records,
+)
+from app.api.v1.schemas import CalculateRequest
 from app.core.config import AppSettings, get_settings
 from app.domain.ddd.entities import DeliveryInfo, PaymentTerm
 from app.infrastructure.google_calendar_holiday_provider import GoogleCalendarHolidayProvider
-from app.use_cases.calculate_due_date import calculate_due_date
+from app.use_cases.calculate_due_date import (
+    calculate_due_date,
+    calculate_due_date_variants,
+    solve_latest_delivery_date,
+    solve_max_days,
+)
+from app.use_cases.estimate_cost import (
+    ZERO_COST,
+    BudgetExceededError,
+    CalculationCost,
+    WorkBudget,
+    estimate_cost,
+    exceeds_calendar_range,
+)
 
 
 router = APIRouter(tags=["calculate"])
 
 
-class CalculateRequest(BaseModel):
-    """DDD 계산 요청 모델"""
-    delivery_date: date = Field(..., description="배송일 (YYYY-MM-DD)")
-    country_codes: list[str] = Field(["KR"], description="국가 코드 목록 (예: ['KR', 'SG'])")
-    term_kind: str = Field(..., description="결제 조건 종류 (DDD/COD/CIA)")
-    days: Optional[int] = Field(None, description="DDD의 경우 배송 후 일수")
-    skip_weekends: bool = Field(True, description="주말 제외 여부")
-    skip_holidays: bool = Field(True, description="공휴일 제외 여부")
-    include_delivery_as_day_one: bool = Field(False, description="공급당일을 1DDD로 포함 (True면 days-1로 계산)")
-    adjust_to_weekday: bool = Field(False, description="결제일이 주말/공휴일이면 이전 평일로 조정")
-
-
 class CalculateResponse(BaseModel):
     """DDD 계산 응답 모델"""
     country_codes: list[str]
@@ -38,38 +50,365 @@ class CalculateResponse(BaseModel):
     holidays_excluded: bool
 
 
-@router.post("/calculate", response_model=CalculateResponse)
+class CalculateBatchRequest(BaseModel):
+    """DDD 일괄 계산 요청 모델"""
+    items: list[CalculateRequest] = Field(..., description="계산 요청 목록")
+
+
+class VariantFlags(BaseModel):
+    """비교할 옵션 조합"""
+    skip_weekends: bool = Field(True, description="주말 제외 여부")
+    skip_holidays: bool = Field(True, description="공휴일 제외 여부")
+    include_delivery_as_day_one: bool = Field(False, description="공급당일을 1DDD로 포함")
+    adjust_to_weekday: bool = Field(False, description="결제일이 주말/공휴일이면 이전 평일로 조정")
+
+
+class CalculateVariantsRequest(BaseModel):
+    """DDD 옵션 조합 비교 요청 모델"""
+    delivery_date: date = Field(..., description="배송일 (YYYY-MM-DD)")
+    country_codes: list[str] = Field(["KR"], description="국가 코드 목록 (예: ['KR', 'SG'])")
+    days: int = Field(..., description="배송 후 일수")
+    variants: Optional[list[VariantFlags]] = Field(
+        None, description="비교할 옵션 조합 (생략하면 4개 옵션의 16개 조합 전체)"
+    )
+
+
+# 비교 행렬의 열 순서
+VARIANT_COLUMNS = [
+    "skip_weekends",
+    "skip_holidays",
+    "include_delivery_as_day_one",
+    "adjust_to_weekday",
+    "due_date",
+    "excluded_weekend_count",
+    "excluded_holiday_count",
+]
+
+
+class CalculateVariantsResponse(BaseModel):
+    """DDD 옵션 조합 비교 응답 모델 (행 = 옵션 조합, 열 = VARIANT_COLUMNS)"""
+    country_codes: list[str]
+    delivery_date: str
+    days: int
+    columns: list[str]
+    rows: list[list[bool | int | str]]
+    holiday_names: dict[str, dict[str, str]]  # {date_string: {country_code: holiday_name}}
+    holidays_excluded: bool
+
+
+class InverseRequest(BaseModel):
+    """목표 지급기일 역산 요청 모델"""
+    solve_for: Literal["delivery_date", "days"] = Field(
+        ..., description="역산 대상 (delivery_date: 가장 늦은 배송일, days: 가장 큰 일수)"
+    )
+    target_due_date: date = Field(..., description="목표 지급기일 (YYYY-MM-DD)")
+    country_codes: list[str] = Field(["KR"], description="국가 코드 목록 (예: ['KR', 'SG'])")
+    delivery_date: Optional[date] = Field(None, description="배송일 (solve_for=days일 때 필수)")
+    days: Optional[int] = Field(None, description="DDD 일수 (solve_for=delivery_date일 때 필수)")
+    earliest_delivery_date: Optional[date] = Field(
+        None, description="탐색할 가장 이른 배송일 (solve_for=delivery_date, 생략하면 일수로부터 추정)"
+    )
+    skip_weekends: bool = Field(True, description="주말 제외 여부")
+    skip_holidays: bool = Field(True, description="공휴일 제외 여부")
+    include_delivery_as_day_one: bool = Field(False, description="공급당일을 1DDD로 포함 (True면 days-1로 계산)")
+    adjust_to_weekday: bool = Field(False, description="결제일이 주말/공휴일이면 이전 평일로 조정")
+
+
+class FeasibleWindow(BaseModel):
+    """목표일 이내 지급기일이 되는 값의 범위 (start ~ end, start가 None이면 하한 없음)"""
+    start: str | int | None
+    end: str | int | None
+
+
+class InverseResponse(BaseModel):
+    """목표 지급기일 역산 응답 모델"""
+    solve_for: str
+    target_due_date: str
+    country_codes: list[str]
+    feasible: bool
+    latest_delivery_date: Optional[str] = None
+    max_days: Optional[int] = None
+    due_date: Optional[str] = None  # 역산된 값의 지급기일
+    feasible_window: FeasibleWindow
+    holidays_excluded: bool
+
+
+# 콘텐츠 협상으로 제공하는 응답 형식 (OpenAPI 문서용)
+BINARY_RESPONSES = {
+    200: {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {},
+            ARROW_STREAM_MEDIA_TYPE: {},
+        },
+    },
+    406: {"description": "지원하지 않는 Accept 미디어 타입"},
+    422: {"description": "작업량 예산 초과 (추정 작업량은 X-Cost-* 헤더와 본문에 포함)"},
+}
+
+
+def _check_budget(
+    request: CalculateRequest,
+    settings: AppSettings,
+) -> CalculationCost:
+    """
+    계산 전에 작업량을 추정하고 요청당 예산을 넘으면 즉시 거부합니다.
+
+    Raises:
+        HTTPException: 예산 초과 또는 지원 날짜 범위 초과 (422)
+    """
+    delivery_info, payment_term = request.to_domain()
+    cost = estimate_cost(delivery_info, payment_term, with_holidays=holidays_enabled(settings))
+
+    if exceeds_calendar_range(delivery_info, cost):
+        _reject("Due date would fall beyond the supported calendar range (9999-12-31)", cost, settings)
+
+    if (
+        cost.walk_steps > settings.max_walk_steps
+        or cost.holiday_fetches > settings.max_holiday_fetches
+        or cost.result_items > settings.max_result_items
+    ):
+        _reject("Request exceeds the per-request work budget", cost, settings)
+
+    return cost
+
+
+def _reject(message: str, cost: CalculationCost, settings: AppSettings) -> None:
+    """예산 초과 요청을 추정 작업량과 함께 거부합니다."""
+    raise HTTPException(
+        status_code=422,
+        detail={
+            "message": message,
+            "estimated_cost": asdict(cost),
+            "budget": {
+                "walk_steps": settings.max_walk_steps,
+                "holiday_fetches": settings.max_holiday_fetches,
+                "result_items": settings.max_result_items,
+                "batch_walk_steps": settings.max_batch_walk_steps,
+            },
+            "hint": (
+                "Split the job, or run it offline without the per-request budget: save each request "
+                "body as one line of an NDJSON ledger and run "
+                "`python -m app.cli bulk ledger.ndjson results.ndjson`"
+            ),
+        },
+        headers=_cost_headers(cost),
+    )
+
+
+def _cost_headers(cost: CalculationCost) -> dict[str, str]:
+    """추정 작업량을 응답 헤더로 변환합니다."""
+    return {
+        "X-Cost-Walk-Steps": str(cost.walk_steps),
+        "X-Cost-Holiday-Fetches": str(cost.holiday_fetches),
+        "X-Cost-Result-Items": str(cost.result_items),
+    }
+
+
+def _calculate_one(
+    request: CalculateRequest,
+    holiday_provider: Optional[GoogleCalendarHolidayProvider],
+) -> CalculateResponse:
+    """단일 요청을 계산하여 응답 모델로 변환합니다."""
+    delivery_info, payment_term = request.to_domain()
+    country_codes = delivery_info.country_codes
+    term_kind = payment_term.kind
+
+    due_result = calculate_due_date(delivery_info, payment_term, holiday_provider)
+
+    # 공휴일 이름 매핑을 문자열 키로 변환 (JSON 직렬화를 위해)
+    holiday_names_str: dict[str, dict[str, str]] = {}
+    if due_result.holiday_names:
+        holiday_names_str = {
+            dt.isoformat(): countries_dict
+            for dt, countries_dict in due_result.holiday_names.items()
+        }
+
+    return CalculateResponse(
+        country_codes=country_codes,
+        delivery_date=request.delivery_date.isoformat(),
+        term_kind=term_kind,
+        days=request.days,
+        due_date=due_result.due_date.isoformat(),
+        excluded_weekends=[dt.isoformat() for dt in due_result.excluded_weekends],
+        excluded_holidays=[dt.isoformat() for dt in due_result.excluded_holidays],
+        holiday_names=holiday_names_str,
+        holidays_excluded=term_kind == "DDD" and holiday_provider is not None,
+    )
+
+
+@router.post("/calculate", response_model=CalculateResponse, responses=BINARY_RESPONSES)
 def calculate(
     request: CalculateRequest,
     settings: AppSettings = Depends(get_settings),
-) -> CalculateResponse:
+    accept: Optional[str] = Header(None),
+) -> Response:
     """
     배송일과 결제 조건을 기반으로 DDD(Due Date Delivery) 결제일을 계산합니다.
 
+    Accept 헤더에 따라 JSON(기본), MessagePack(`application/msgpack`),
+    Arrow IPC 스트림(`application/vnd.apache.arrow.stream`)으로 응답합니다.
+
     Args:
         request: 계산 요청 (배송일, 국가 코드, 결제 조건 등)
         settings: 앱 설정
+        accept: Accept 헤더
 
     Returns:
         계산 결과 (결제일, 제외된 주말/공휴일 등)
     """
-    # 국가 코드 정규화
-    country_codes = [c.upper() for c in request.country_codes]
-    term_kind = request.term_kind.strip().upper()
+    media_type = negotiate_media_type(accept)
+
+    # 작업량 예산 확인 (초과 시 공휴일 조회 전에 즉시 거부)
+    cost = _check_budget(request, settings)
 
     # Google Calendar API 초기화 (API Key가 있는 경우)
     # 달력 표시를 위해 항상 공휴일 정보 로드
-    holiday_provider = None
-    if settings.google_cal_api_key:
-        holiday_provider = GoogleCalendarHolidayProvider(settings.google_cal_api_key)
+    holiday_provider = get_holiday_provider(settings)
+
+    result = _calculate_one(request, holiday_provider)
+    response = render_records([result], media_type, single=True)
+    response.headers.update(_cost_headers(cost))
+    return response
+
+
+@router.post("/calculate/batch", response_model=list[CalculateResponse], responses=BINARY_RESPONSES)
+def calculate_batch(
+    request: CalculateBatchRequest,
+    settings: AppSettings = Depends(get_settings),
+    accept: Optional[str] = Header(None),
+) -> Response:
+    """
+    여러 건의 DDD 결제일을 한 번에 계산합니다.
+
+    하나의 공휴일 제공자를 공유하므로 같은 (국가, 연도)의 공휴일은 한 번만 조회합니다.
+    Arrow IPC 스트림으로 요청하면 결과 전체가 하나의 컬럼 배치로 반환됩니다.
+
+    Args:
+        request: 일괄 계산 요청
+        settings: 앱 설정
+        accept: Accept 헤더
+
+    Returns:
+        요청 순서와 동일한 계산 결과 목록
+    """
+    media_type = negotiate_media_type(accept)
+
+    # 항목별 예산과 일괄 요청 전체 예산 확인
+    cost = ZERO_COST
+    for item in request.items:
+        cost += _check_budget(item, settings)
+    if cost.walk_steps > settings.max_batch_walk_steps:
+        _reject("Batch exceeds the batch work budget", cost, settings)
+
+    holiday_provider = get_holiday_provider(settings)
+
+    results = [_calculate_one(item, holiday_provider) for item in request.items]
+    response = render_records(results, media_type)
+    response.headers.update(_cost_headers(cost))
+    return response
+
+
+@router.post("/calculate/variants", response_model=CalculateVariantsResponse)
+def calculate_variants(
+    request: CalculateVariantsRequest,
+    response: Response,
+    settings: AppSettings = Depends(get_settings),
+) -> CalculateVariantsResponse:
+    """
+    하나의 배송에 대해 여러 옵션 조합의 DDD 결제일을 비교합니다.
+
+    공휴일은 한 번만 로드하고 모든 조합을 같은 달력 위에서 함께 계산하여
+    조합별 결제일과 제외 일수를 행렬로 반환합니다.
+
+    Args:
+        request: 비교 요청 (배송일, 국가 코드, 일수, 옵션 조합)
+        response: 응답 (작업량 헤더 설정용)
+        settings: 앱 설정
+
+    Returns:
+        옵션 조합별 결제일 비교 행렬
+    """
+    variants = request.variants
+    if variants is None:
+        variants = [
+            VariantFlags(
+                skip_weekends=skip_weekends,
+                skip_holidays=skip_holidays,
+                include_delivery_as_day_one=include_delivery_as_day_one,
+                adjust_to_weekday=adjust_to_weekday,
+            )
+            for skip_weekends, skip_holidays, include_delivery_as_day_one, adjust_to_weekday
+            in product((True, False), repeat=4)
+        ]
 
-    # DDD 계산
+    # 한 번의 순회 비용은 가장 긴 조합(주말·공휴일 모두 제외)으로 추정
+    cost = _check_budget(
+        CalculateRequest(
+            delivery_date=request.delivery_date,
+            country_codes=request.country_codes,
+            term_kind="DDD",
+            days=request.days,
+        ),
+        settings,
+    )
+    response.headers.update(_cost_headers(cost))
+
+    holiday_provider = get_holiday_provider(settings)
     delivery_info = DeliveryInfo(
         delivery_date=request.delivery_date,
-        country_codes=country_codes
+        country_codes=[c.upper() for c in request.country_codes],
+    )
+    terms = [
+        PaymentTerm(kind="DDD", days=request.days, **variant.model_dump())
+        for variant in variants
+    ]
+
+    results, holiday_names = calculate_due_date_variants(delivery_info, terms, holiday_provider)
+
+    return CalculateVariantsResponse(
+        country_codes=delivery_info.country_codes,
+        delivery_date=request.delivery_date.isoformat(),
+        days=request.days,
+        columns=VARIANT_COLUMNS,
+        rows=[
+            [
+                variant.skip_weekends,
+                variant.skip_holidays,
+                variant.include_delivery_as_day_one,
+                variant.adjust_to_weekday,
+                result.due_date.isoformat(),
+                len(result.excluded_weekends),
+                len(result.excluded_holidays),
+            ]
+            for variant, result in zip(variants, results)
+        ],
+        holiday_names={dt.isoformat(): names for dt, names in holiday_names.items()},
+        holidays_excluded=holiday_provider is not None,
     )
-    payment_term = PaymentTerm(
-        kind=term_kind,
+
+
+@router.post("/calculate/inverse", response_model=InverseResponse)
+def calculate_inverse(
+    request: InverseRequest,
+    response: Response,
+    settings: AppSettings = Depends(get_settings),
+) -> InverseResponse:
+    """
+    목표 지급기일 이내가 되는 가장 늦은 배송일 또는 가장 큰 DDD 일수를 역산합니다.
+
+    연도별 누적 영업일 수로 만든 색인 위에서 이분 탐색하므로 날짜 단위 전진 계산이 없습니다.
+
+    Args:
+        request: 역산 요청 (목표 지급기일, 역산 대상, 국가 코드, 옵션 등)
+        response: 응답 (작업량 헤더 설정용)
+        settings: 앱 설정
+
+    Returns:
+        역산 결과와 가능한 범위
+    """
+    country_codes = [c.upper() for c in request.country_codes]
+    term = PaymentTerm(
+        kind="DDD",
         days=request.days,
         skip_weekends=request.skip_weekends,
         skip_holidays=request.skip_holidays,
@@ -77,24 +416,84 @@ def calculate(
         adjust_to_weekday=request.adjust_to_weekday,
     )
 
-    due_result = calculate_due_date(delivery_info, payment_term, holiday_provider)
+    with_holidays = holidays_enabled(settings)
+    if request.solve_for == "delivery_date":
+        if request.days is None:
+            raise HTTPException(status_code=422, detail="'days' is required when solving for delivery_date")
+        # 목표일에서 거꾸로 탐색하므로 지원 날짜 범위(9999-12-31)는 확인하지 않음
+        cost = estimate_cost(
+            DeliveryInfo(delivery_date=request.target_due_date, country_codes=country_codes),
+            term,
+            with_holidays=with_holidays,
+        )
+        earliest = request.earliest_delivery_date
+        if earliest is not None and (request.target_due_date - earliest).days > settings.max_walk_steps:
+            _reject("earliest_delivery_date is too far before target_due_date", cost, settings)
+    else:
+        if request.delivery_date is None:
+            raise HTTPException(status_code=422, detail="'delivery_date' is required when solving for days")
+        span = max((request.target_due_date - request.delivery_date).days, 0)
+        cost = estimate_cost(
+            DeliveryInfo(delivery_date=request.delivery_date, country_codes=country_codes),
+            PaymentTerm(kind="DDD", days=span, skip_weekends=False, skip_holidays=False),
+            with_holidays=with_holidays,
+        )
+    if cost.walk_steps > settings.max_walk_steps or cost.holiday_fetches > settings.max_holiday_fetches:
+        _reject("Request exceeds the per-request work budget", cost, settings)
+    response.headers.update(_cost_headers(cost))
 
-    # 공휴일 이름 매핑을 문자열 키로 변환 (JSON 직렬화를 위해)
-    holiday_names_str: dict[str, dict[str, str]] = {}
-    if due_result.holiday_names:
-        holiday_names_str = {
-            dt.isoformat(): countries_dict
-            for dt, countries_dict in due_result.holiday_names.items()
-        }
+    # 탐색 구간을 넓히거나 색인할 때마다 유스케이스에서 예산을 다시 확인
+    budget = WorkBudget(walk_steps=settings.max_walk_steps, holiday_fetches=settings.max_holiday_fetches)
 
-    return CalculateResponse(
+    holiday_provider = get_holiday_provider(settings)
+    result = InverseResponse(
+        solve_for=request.solve_for,
+        target_due_date=request.target_due_date.isoformat(),
         country_codes=country_codes,
-        delivery_date=request.delivery_date.isoformat(),
-        term_kind=term_kind,
-        days=request.days,
-        due_date=due_result.due_date.isoformat(),
-        excluded_weekends=[dt.isoformat() for dt in due_result.excluded_weekends],
-        excluded_holidays=[dt.isoformat() for dt in due_result.excluded_holidays],
-        holiday_names=holiday_names_str,
-        holidays_excluded=term_kind == "DDD" and holiday_provider is not None,
+        feasible=False,
+        feasible_window=FeasibleWindow(start=None, end=None),
+        holidays_excluded=holiday_provider is not None,
     )
+
+    if request.solve_for == "delivery_date":
+        try:
+            window = solve_latest_delivery_date(
+                country_codes,
+                term,
+                request.target_due_date,
+                holiday_provider,
+                earliest_delivery_date=request.earliest_delivery_date,
+                budget=budget,
+            )
+        except BudgetExceededError as e:
+            _reject(str(e), e.cost, settings)
+        latest = window.latest_delivery_date
+        result.feasible = latest is not None
+        result.latest_delivery_date = latest.isoformat() if latest else None
+        result.due_date = window.due_date.isoformat() if window.due_date else None
+        # 더 이른 배송일은 항상 가능하므로, 하한은 요청한 가장 이른 배송일 (없으면 제한 없음)
+        earliest = request.earliest_delivery_date
+        result.feasible_window = FeasibleWindow(
+            start=earliest.isoformat() if earliest and result.feasible else None,
+            end=result.latest_delivery_date,
+        )
+    else:
+        try:
+            days_window = solve_max_days(
+                DeliveryInfo(delivery_date=request.delivery_date, country_codes=country_codes),
+                term,
+                request.target_due_date,
+                holiday_provider,
+                budget=budget,
+            )
+        except BudgetExceededError as e:
+            _reject(str(e), e.cost, settings)
+        result.feasible = days_window.max_days is not None
+        result.max_days = days_window.max_days
+        result.due_date = days_window.due_date.isoformat() if days_window.due_date else None
+        result.feasible_window = FeasibleWindow(
+            start=days_window.min_days if result.feasible else None,
+            end=days_window.max_days,
+        )
+
+    return result
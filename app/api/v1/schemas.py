@@ -0,0 +1,34 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.domain.ddd.entities import DeliveryInfo, PaymentTerm
+
+
+class CalculateRequest(BaseModel):
+    """DDD 계산 요청 모델 (API와 bulk CLI가 함께 사용)"""
+    delivery_date: date = Field(..., description="배송일 (YYYY-MM-DD)")
+    country_codes: list[str] = Field(["KR"], description="국가 코드 목록 (예: ['KR', 'SG'])")
+    term_kind: str = Field(..., description="결제 조건 종류 (DDD/COD/CIA)")
+    days: Optional[int] = Field(None, description="DDD의 경우 배송 후 일수")
+    skip_weekends: bool = Field(True, description="주말 제외 여부")
+    skip_holidays: bool = Field(True, description="공휴일 제외 여부")
+    include_delivery_as_day_one: bool = Field(False, description="공급당일을 1DDD로 포함 (True면 days-1로 계산)")
+    adjust_to_weekday: bool = Field(False, description="결제일이 주말/공휴일이면 이전 평일로 조정")
+
+    def to_domain(self) -> tuple[DeliveryInfo, PaymentTerm]:
+        """요청 모델을 도메인 객체로 변환합니다 (국가 코드/결제 조건 정규화 포함)."""
+        delivery_info = DeliveryInfo(
+            delivery_date=self.delivery_date,
+            country_codes=[c.upper() for c in self.country_codes],
+        )
+        payment_term = PaymentTerm(
+            kind=self.term_kind.strip().upper(),
+            days=self.days,
+            skip_weekends=self.skip_weekends,
+            skip_holidays=self.skip_holidays,
+            include_delivery_as_day_one=self.include_delivery_as_day_one,
+            adjust_to_weekday=self.adjust_to_weekday,
+        )
+        return delivery_info, payment_term
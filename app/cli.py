@@ -0,0 +1,607 @@
+"""
+DDD 계산기 명령줄 도구
+
+사용 예:
+    python -m app.cli bulk ledger.csv results.parquet --workers 8
+    python -m app.cli bulk ledger.ndjson results.csv --resume
+    python -m app.cli build-static
+    python -m app.cli export-bundle holidays.bundle --countries KR SG --years 2024-2027
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from pydantic import ValidationError
+
+from app.api.v1.schemas import CalculateRequest
+from app.core.config import get_settings
+from app.core.logging_config import configure_logging
+from app.infrastructure.google_calendar_holiday_provider import (
+    GoogleCalendarHolidayProvider,
+    HolidayFetchError,
+)
+from app.infrastructure.holiday_provider import HolidayProvider
+from app.infrastructure.static_holiday_provider import MissingHolidayYearError, StaticHolidayProvider
+from app.use_cases.calculate_due_date import calculate_due_date
+from app.use_cases.estimate_cost import estimate_cost, exceeds_calendar_range
+
+
+# 출력 레코드 필드 (row는 원장 파일 내 0부터 시작하는 행 번호)
+OUTPUT_FIELDS = [
+    "row",
+    "delivery_date",
+    "country_codes",
+    "term_kind",
+    "days",
+    "due_date",
+    "excluded_weekend_count",
+    "excluded_holiday_count",
+    "excluded_weekends",
+    "excluded_holidays",
+    "holidays_excluded",
+    "error",
+]
+
+# CSV에서 목록 값을 구분하는 문자 (예: "KR;SG")
+LIST_SEPARATOR = ";"
+
+# 행 하나당 사전 로드하는 최대 연도 수 (나머지는 메인 프로세스에서 필요할 때 조회)
+PRELOAD_MAX_YEARS_PER_ROW = 5
+
+# 작업 프로세스에서 공유하는 읽기 전용 공휴일 스냅샷 (initializer에서 한 번만 설정)
+_worker_provider: Optional[HolidayProvider] = None
+
+
+# ---------------------------------------------------------------------------
+# 원장 읽기 / 공휴일 사전 로드
+# ---------------------------------------------------------------------------
+
+def read_ledger(path: Path) -> list[dict[str, Any]]:
+    """배송 원장 파일(CSV 또는 NDJSON)을 행 목록으로 읽습니다."""
+    suffix = path.suffix.lower()
+    rows: list[dict[str, Any]] = []
+
+    if suffix == ".csv":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for raw in csv.DictReader(f):
+                # 빈 칸은 기본값을 쓰도록 제거
+                row: dict[str, Any] = {k: v for k, v in raw.items() if v not in (None, "")}
+                if "country_codes" in row:
+                    row["country_codes"] = [
+                        code.strip()
+                        for code in row["country_codes"].replace(",", LIST_SEPARATOR).split(LIST_SEPARATOR)
+                        if code.strip()
+                    ]
+                rows.append(row)
+    elif suffix in (".ndjson", ".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    rows.append(json.loads(line))
+    else:
+        raise ValueError(f"Unsupported ledger format: {path.suffix} (use .csv, .ndjson or .jsonl)")
+
+    return rows
+
+
+def check_row_range(request: CalculateRequest, with_holidays: bool) -> Optional[str]:
+    """
+    결제일이 지원 날짜 범위(9999-12-31)를 넘을 행을 찾습니다.
+
+    bulk는 대량 작업 경로이므로 API의 요청당 작업량 예산은 적용하지 않습니다.
+
+    Args:
+        request: 행 요청
+        with_holidays: 공휴일 제공자 사용 여부 (순회 길이 추정에 반영)
+
+    Returns:
+        지원 날짜 범위 초과 시 오류 메시지, 아니면 None
+    """
+    delivery_info, payment_term = request.to_domain()
+    cost = estimate_cost(delivery_info, payment_term, with_holidays=with_holidays)
+    if exceeds_calendar_range(delivery_info, cost):
+        return "Due date would fall beyond the supported calendar range (9999-12-31)"
+    return None
+
+
+def _preload_years(request: CalculateRequest) -> range:
+    """행 하나에 대해 사전 로드할 연도 범위 (추정 순회 범위, 최대 PRELOAD_MAX_YEARS_PER_ROW년)"""
+    delivery_info, payment_term = request.to_domain()
+    cost = estimate_cost(delivery_info, payment_term)
+    first_year = request.delivery_date.year
+    last_year = date.fromordinal(request.delivery_date.toordinal() + cost.walk_steps).year
+    return range(first_year, min(last_year, first_year + PRELOAD_MAX_YEARS_PER_ROW - 1) + 1)
+
+
+def preload_holidays(
+    holiday_provider: HolidayProvider,
+    requests: Iterable[CalculateRequest],
+) -> dict[tuple[str, int], dict[date, str]]:
+    """
+    원장 전체에 필요한 (국가, 연도) 공휴일을 한 번만 조회하여 스냅샷을 만듭니다.
+
+    지원 날짜 범위 검사를 통과한 요청만 넘겨야 합니다. 행당 사전 로드 연도 수는 제한되며,
+    범위를 벗어나는 행은 계산 시 MissingHolidayYearError로 감지되어
+    메인 프로세스에서 다시 계산됩니다.
+    """
+    country_years: set[tuple[str, int]] = set()
+    for request in requests:
+        if request.term_kind.strip().upper() != "DDD":
+            continue
+        for country_code in request.country_codes:
+            for year in _preload_years(request):
+                country_years.add((country_code.upper(), year))
+
+    return {
+        (country_code, year): holiday_provider.get_holidays(
+            country_code, date(year, 1, 1), date(year, 12, 31)
+        )
+        for country_code, year in sorted(country_years)
+    }
+
+
+# ---------------------------------------------------------------------------
+# 행 계산
+# ---------------------------------------------------------------------------
+
+def _error_record(index: int, message: str) -> dict[str, Any]:
+    record: dict[str, Any] = {field: None for field in OUTPUT_FIELDS}
+    record.update(row=index, error=message)
+    return record
+
+
+def _calculate_record(
+    index: int,
+    request: CalculateRequest,
+    holiday_provider: Optional[HolidayProvider],
+) -> dict[str, Any]:
+    """한 행을 계산하여 출력 레코드로 변환합니다."""
+    delivery_info, payment_term = request.to_domain()
+    country_codes = delivery_info.country_codes
+    term_kind = payment_term.kind
+
+    try:
+        result = calculate_due_date(delivery_info, payment_term, holiday_provider)
+    except (ValueError, OverflowError) as e:
+        return _error_record(index, str(e))
+
+    return {
+        "row": index,
+        "delivery_date": request.delivery_date.isoformat(),
+        "country_codes": country_codes,
+        "term_kind": term_kind,
+        "days": request.days,
+        "due_date": result.due_date.isoformat(),
+        "excluded_weekend_count": len(result.excluded_weekends),
+        "excluded_holiday_count": len(result.excluded_holidays),
+        "excluded_weekends": [dt.isoformat() for dt in result.excluded_weekends],
+        "excluded_holidays": [dt.isoformat() for dt in result.excluded_holidays],
+        "holidays_excluded": term_kind == "DDD" and holiday_provider is not None,
+        "error": None,
+    }
+
+
+def _init_worker(snapshot: Optional[dict[tuple[str, int], dict[date, str]]]) -> None:
+    """작업 프로세스 초기화: 공휴일 스냅샷을 프로세스당 한 번만 받아 둡니다."""
+    global _worker_provider
+    _worker_provider = StaticHolidayProvider(snapshot) if snapshot is not None else None
+
+
+def _process_task(
+    task: tuple[int, Optional[CalculateRequest], Optional[str]],
+) -> tuple[dict[str, Any], bool]:
+    """
+    작업 프로세스에서 한 행을 계산합니다.
+
+    Returns:
+        (출력 레코드, 메인 프로세스에서 다시 계산해야 하는지 여부)
+    """
+    index, request, error = task
+    if request is None:
+        return _error_record(index, error or "invalid row"), False
+    try:
+        return _calculate_record(index, request, _worker_provider), False
+    except MissingHolidayYearError:
+        # 작업 프로세스는 외부 조회를 하지 않으므로 메인 프로세스로 넘김
+        return _error_record(index, "holiday snapshot miss"), True
+
+
+# ---------------------------------------------------------------------------
+# 결과 쓰기 (이어쓰기 지원)
+# ---------------------------------------------------------------------------
+
+class _TextResultWriter(ABC):
+    """줄 단위 텍스트 출력(CSV/NDJSON)의 공통 동작"""
+
+    has_header = False
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+
+    def completed_rows(self) -> int:
+        """
+        이미 기록된 마지막 행 다음의 행 번호를 반환합니다.
+
+        중단 시 남은 불완전한 마지막 줄은 잘라냅니다.
+        """
+        if not self.path.exists():
+            return 0
+
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            cut = data.rfind(b"\n") + 1
+            if cut < len(data):
+                f.truncate(cut)
+                data = data[:cut]
+
+        lines = data.decode("utf-8").splitlines()
+        if self.has_header:
+            lines = lines[1:]
+        if not lines:
+            return 0
+        return self._row_of(lines[-1]) + 1
+
+    @abstractmethod
+    def _row_of(self, line: str) -> int:
+        """기록된 한 줄에서 행 번호를 읽습니다."""
+        pass
+
+    @abstractmethod
+    def write(self, record: dict[str, Any]) -> None:
+        """출력 레코드 하나를 기록합니다."""
+        pass
+
+    def open(self, append: bool) -> None:
+        append = append and self.path.exists() and self.path.stat().st_size > 0
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8", newline="")
+        self._start(write_header=not append)
+
+    def _start(self, write_header: bool) -> None:
+        pass
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class CsvResultWriter(_TextResultWriter):
+    has_header = True
+
+    def _row_of(self, line: str) -> int:
+        return int(next(csv.reader([line]))[0])
+
+    def _start(self, write_header: bool) -> None:
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(OUTPUT_FIELDS)
+
+    def write(self, record: dict[str, Any]) -> None:
+        values = []
+        for field in OUTPUT_FIELDS:
+            value = record[field]
+            if isinstance(value, list):
+                value = LIST_SEPARATOR.join(value)
+            values.append("" if value is None else value)
+        self._writer.writerow(values)
+
+
+class NdjsonResultWriter(_TextResultWriter):
+    def _row_of(self, line: str) -> int:
+        return int(json.loads(line)["row"])
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class ParquetResultWriter:
+    """
+    Parquet 출력. 중단 후 이어쓰기를 위해 `<output>.parts/`에 완결된 파트 파일로
+    나누어 기록하고, 모든 행이 끝나면 하나의 파일로 합칩니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.parts_dir = path.with_name(path.name + ".parts")
+        self._buffer: list[dict[str, Any]] = []
+
+    @staticmethod
+    def _schema():
+        import pyarrow as pa
+
+        return pa.schema([
+            ("row", pa.int64()),
+            ("delivery_date", pa.date32()),
+            ("country_codes", pa.list_(pa.string())),
+            ("term_kind", pa.string()),
+            ("days", pa.int32()),
+            ("due_date", pa.date32()),
+            ("excluded_weekend_count", pa.int32()),
+            ("excluded_holiday_count", pa.int32()),
+            ("excluded_weekends", pa.list_(pa.date32())),
+            ("excluded_holidays", pa.list_(pa.date32())),
+            ("holidays_excluded", pa.bool_()),
+            ("error", pa.string()),
+        ])
+
+    def _parts(self) -> list[Path]:
+        return sorted(self.parts_dir.glob("part-*.parquet"))
+
+    def completed_rows(self) -> int:
+        import pyarrow.parquet as pq
+
+        # 이전 실행이 이미 합쳐 둔 결과 파일이 있으면 그 파일을 기준으로 함
+        parts = self._parts()
+        last_file = parts[-1] if parts else (self.path if self.path.exists() else None)
+        if last_file is None:
+            return 0
+        rows = pq.read_table(last_file, columns=["row"]).column("row")
+        return int(rows[-1].as_py()) + 1 if len(rows) else 0
+
+    def open(self, append: bool) -> None:
+        if not append and self.parts_dir.exists():
+            shutil.rmtree(self.parts_dir)
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        if append and not self._parts() and self.path.exists():
+            os.replace(self.path, self.parts_dir / "part-000000.parquet")
+
+    def write(self, record: dict[str, Any]) -> None:
+        self._buffer.append(record)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def to_date(value: Optional[str]) -> Optional[date]:
+            return date.fromisoformat(value) if value else None
+
+        rows = [
+            {
+                **record,
+                "delivery_date": to_date(record["delivery_date"]),
+                "due_date": to_date(record["due_date"]),
+                "excluded_weekends": [to_date(v) for v in record["excluded_weekends"] or []],
+                "excluded_holidays": [to_date(v) for v in record["excluded_holidays"] or []],
+            }
+            for record in self._buffer
+        ]
+        table = pa.Table.from_pylist(rows, schema=self._schema())
+
+        # 임시 파일에 쓴 뒤 이름을 바꿔 파트 파일이 항상 완결되도록 함
+        part_path = self.parts_dir / f"part-{len(self._parts()):06d}.parquet"
+        tmp_path = part_path.with_suffix(".tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, part_path)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.flush()
+        parts = self._parts()
+        tables = [pq.read_table(part) for part in parts]
+        table = pa.concat_tables(tables) if tables else self._schema().empty_table()
+        pq.write_table(table, self.path)
+        shutil.rmtree(self.parts_dir)
+
+
+OUTPUT_WRITERS = {
+    "csv": CsvResultWriter,
+    "ndjson": NdjsonResultWriter,
+    "parquet": ParquetResultWriter,
+}
+
+
+def _detect_output_format(path: Path) -> str:
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix == "jsonl":
+        return "ndjson"
+    if suffix in OUTPUT_WRITERS:
+        return suffix
+    raise ValueError(f"Cannot infer output format from '{path.name}'; use --format")
+
+
+# ---------------------------------------------------------------------------
+# bulk 명령
+# ---------------------------------------------------------------------------
+
+def _report_progress(done: int, total: int, started_at: float, processed: int) -> None:
+    elapsed = max(time.monotonic() - started_at, 1e-9)
+    percent = done / total * 100 if total else 100.0
+    print(
+        f"[bulk] {done}/{total} rows ({percent:.1f}%) {processed / elapsed:.1f} rows/s",
+        file=sys.stderr,
+    )
+
+
+def run_bulk(args: argparse.Namespace) -> int:
+    """원장 파일의 모든 행을 병렬로 계산하여 결과 파일로 씁니다."""
+    ledger_path = Path(args.ledger)
+    output_path = Path(args.output)
+    output_format = args.format or _detect_output_format(output_path)
+    writer = OUTPUT_WRITERS[output_format](output_path)
+
+    raw_rows = read_ledger(ledger_path)
+    total = len(raw_rows)
+
+    start_row = writer.completed_rows() if args.resume else 0
+    if start_row:
+        print(f"[bulk] resuming from row {start_row}", file=sys.stderr)
+
+    # 행 검증 (잘못된 행과 지원 날짜 범위를 넘는 행은 오류 레코드로 기록)
+    settings = get_settings()
+    with_holidays = bool(settings.google_cal_api_key) and not args.no_holidays
+    tasks: list[tuple[int, Optional[CalculateRequest], Optional[str]]] = []
+    for index in range(start_row, total):
+        try:
+            request = CalculateRequest.model_validate(raw_rows[index])
+        except ValidationError as e:
+            tasks.append((index, None, str(e).replace("\n", " ")))
+            continue
+        error = check_row_range(request, with_holidays)
+        tasks.append((index, None, error) if error else (index, request, None))
+
+    # 공휴일은 메인 프로세스에서 한 번만 조회하여 작업 프로세스와 공유
+    holiday_provider: Optional[HolidayProvider] = None
+    snapshot: Optional[dict[tuple[str, int], dict[date, str]]] = None
+    if with_holidays:
+        holiday_provider = GoogleCalendarHolidayProvider(settings.google_cal_api_key)
+        snapshot = preload_holidays(holiday_provider, (req for _, req, _ in tasks if req is not None))
+        print(f"[bulk] preloaded {len(snapshot)} (country, year) holiday sets", file=sys.stderr)
+
+    writer.open(append=args.resume)
+    started_at = time.monotonic()
+    processed = 0
+    fallbacks = 0
+
+    try:
+        if args.workers > 1:
+            pool = multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(snapshot,))
+            results = pool.imap(_process_task, tasks, chunksize=args.chunksize)
+        else:
+            pool = None
+            _init_worker(snapshot)
+            results = map(_process_task, tasks)
+
+        try:
+            for (index, request, _), (record, needs_fallback) in zip(tasks, results):
+                if needs_fallback:
+                    # 스냅샷 범위를 벗어난 행은 메인 프로세스의 공급자로 계산
+                    record = _calculate_record(index, request, holiday_provider)
+                    fallbacks += 1
+                writer.write(record)
+                processed += 1
+
+                if processed % args.batch_size == 0:
+                    writer.flush()
+                if processed % args.progress_every == 0:
+                    _report_progress(start_row + processed, total, started_at, processed)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        writer.flush()
+    finally:
+        writer.close()
+
+    _report_progress(start_row + processed, total, started_at, processed)
+    if fallbacks:
+        print(f"[bulk] {fallbacks} rows recomputed outside the holiday snapshot", file=sys.stderr)
+    return 0
+
+
+def run_build_static(args: argparse.Namespace) -> int:
+    """정적 자산을 압축/핑거프린트/사전 압축하여 `app/static/dist/`에 빌드합니다."""
+    from app.web.assets import build_assets
+
+    manifest = build_assets()
+    for name, built in manifest.items():
+        print(f"[build-static] {name} -> {built}", file=sys.stderr)
+    return 0
+
+
+def _parse_years(values: list[str]) -> list[int]:
+    """연도 인자를 펼칩니다 (예: ["2024-2026", "2030"] -> [2024, 2025, 2026, 2030])."""
+    years: set[int] = set()
+    for value in values:
+        first, _, last = value.partition("-")
+        years.update(range(int(first), int(last or first) + 1))
+    return sorted(years)
+
+
+def _require_holiday_provider(strict: bool = False) -> GoogleCalendarHolidayProvider:
+    settings = get_settings()
+    if not settings.google_cal_api_key:
+        raise SystemExit("GOOGLE_CAL_API_KEY is required to export a holiday bundle")
+    return GoogleCalendarHolidayProvider(settings.google_cal_api_key, strict=strict)
+
+
+def run_export_bundle(args: argparse.Namespace) -> int:
+    """지정한 국가·연도의 공휴일 캐시를 하나의 번들 파일로 내보냅니다."""
+    from app.infrastructure.holiday_bundle import export_bundle
+
+    country_codes = args.countries or sorted(GoogleCalendarHolidayProvider.CALENDAR_IDS)
+    years = _parse_years(args.years)
+    # 조회 실패 연도를 빈 공휴일로 내보내지 않도록 strict 모드로 조회
+    try:
+        data = export_bundle(_require_holiday_provider(strict=True), country_codes, years)
+    except HolidayFetchError as e:
+        raise SystemExit(f"[export-bundle] {e}")
+    Path(args.output).write_bytes(data)
+    print(
+        f"[export-bundle] {len(country_codes)} countries x {len(years)} years -> {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def run_import_bundle(args: argparse.Namespace) -> int:
+    """번들 파일을 검증하여 파일 캐시(.cache/holidays)에 적재합니다."""
+    from app.infrastructure.holiday_bundle import HolidayBundleError, read_bundle
+
+    try:
+        holidays = read_bundle(Path(args.bundle).read_bytes())
+    except HolidayBundleError as e:
+        raise SystemExit(f"[import-bundle] {e}")
+    # 적재는 API를 호출하지 않으므로 API Key 없이도 가능 (외부망이 없는 노드)
+    imported = GoogleCalendarHolidayProvider(get_settings().google_cal_api_key).seed_holidays(holidays)
+    print(f"[import-bundle] {imported} (country, year) holiday sets cached", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="DDD Calculator CLI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bulk = subparsers.add_parser("bulk", help="배송 원장 파일을 일괄 계산")
+    bulk.add_argument("ledger", help="배송 원장 파일 (.csv, .ndjson, .jsonl)")
+    bulk.add_argument("output", help="결과 파일 (.csv, .ndjson, .parquet)")
+    bulk.add_argument("--format", choices=sorted(OUTPUT_WRITERS), help="출력 형식 (기본: 확장자로 판단)")
+    bulk.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="작업 프로세스 수")
+    bulk.add_argument("--chunksize", type=int, default=256, help="작업 프로세스에 한 번에 보낼 행 수")
+    bulk.add_argument("--batch-size", type=int, default=10_000, help="디스크에 기록하는 행 단위")
+    bulk.add_argument("--progress-every", type=int, default=10_000, help="진행률 출력 간격 (행)")
+    bulk.add_argument("--resume", action="store_true", help="기존 결과 파일의 마지막 완료 행 다음부터 이어서 계산")
+    bulk.add_argument("--no-holidays", action="store_true", help="공휴일을 조회하지 않음")
+    bulk.set_defaults(handler=run_bulk)
+
+    build_static = subparsers.add_parser("build-static", help="정적 자산 빌드 (minify, 핑거프린트, gzip/brotli)")
+    build_static.set_defaults(handler=run_build_static)
+
+    export = subparsers.add_parser("export-bundle", help="공휴일 캐시를 번들 파일로 내보내기")
+    export.add_argument("output", help="번들 파일 경로")
+    export.add_argument("--countries", nargs="+", help="국가 코드 (기본: 지원하는 모든 국가)")
+    export.add_argument("--years", nargs="+", required=True, help="연도 또는 범위 (예: 2024-2027 2030)")
+    export.set_defaults(handler=run_export_bundle)
+
+    import_ = subparsers.add_parser("import-bundle", help="번들 파일을 공휴일 파일 캐시에 적재")
+    import_.add_argument("bundle", help="번들 파일 경로")
+    import_.set_defaults(handler=run_import_bundle)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(get_settings().log_level)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,17 @@ class AppSettings(BaseSettings):
     app_name: str = "DDD Calculator API"
     api_prefix: str = "/api/v1"
     debug: bool = False
+    log_level: str = "INFO"
+    public_base_url: str = ""  # 정규 URL(og:url, canonical) (예: https://ddd.example.com/, 비어 있으면 생략)
     google_cal_api_key: str = ""
+    holiday_bundle_path: str = ""  # 시작 시 적재할 공휴일 번들 파일 (python -m app.cli export-bundle)
+    admin_token: str = ""  # 관리자 API 토큰 (비어 있으면 관리자 API 비활성화)
+
+    # 요청당 작업량 예산 (초과 시 422로 즉시 거부, 대량 작업은 bulk CLI 사용)
+    max_walk_steps: int = 36_500  # 영업일 순회 달력 일수 (약 100년)
+    max_holiday_fetches: int = 200  # (국가, 연도) 공휴일 조회 수
+    max_result_items: int = 30_000  # 응답의 제외 날짜 수
+    max_batch_walk_steps: int = 1_000_000  # 일괄 요청 전체 순회 일수
 
 
 class HealthStatus(BaseModel):
@@ -0,0 +1,209 @@
+"""구조화 로깅: 큐 기반 비차단 핸들러로 JSON 레코드를 출력합니다."""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+# 레코드에서 JSON으로 내보낼 구조화 필드 (logger.info(..., extra={...})로 전달)
+STRUCTURED_FIELDS = (
+    "country",
+    "year",
+    "cache_tier",
+    "latency_ms",
+    "outcome",
+    "count",
+    "error",
+)
+
+# 이벤트별 샘플링 비율 (1.0 = 모두 기록)
+DEFAULT_SAMPLE_RATES: dict[str, float] = {
+    "holiday.lookup": 0.01,  # 메모리 캐시 적중 등 요청마다 발생하는 이벤트
+}
+
+# 이벤트별 초당 최대 기록 수
+DEFAULT_RATE_LIMIT_PER_SECOND = 50
+
+# 큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버림
+DEFAULT_QUEUE_SIZE = 10_000
+
+# 버린 레코드 수를 보고하는 최소 간격 (초)
+DEFAULT_DROP_REPORT_INTERVAL = 10.0
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 변환합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class EventSampler(logging.Filter):
+    """
+    이벤트(메시지)별 샘플링과 초당 기록 수 제한.
+
+    WARNING 이상은 샘플링하지 않지만 초당 제한은 동일하게 적용합니다.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Optional[dict[str, float]] = None,
+        rate_limit_per_second: int = DEFAULT_RATE_LIMIT_PER_SECOND,
+    ):
+        super().__init__()
+        self.sample_rates = dict(DEFAULT_SAMPLE_RATES if sample_rates is None else sample_rates)
+        self.rate_limit_per_second = rate_limit_per_second
+        # 이벤트별 (현재 1초 구간 시작 시각, 구간 내 기록 수)
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = str(record.msg)
+
+        if record.levelno < logging.WARNING:
+            rate = self.sample_rates.get(event, 1.0)
+            if rate < 1.0 and random.random() >= rate:
+                return False
+
+        now = time.monotonic()
+        with self._lock:
+            window_start, count = self._windows.get(event, (now, 0))
+            if now - window_start >= 1.0:
+                window_start, count = now, 0
+            if count >= self.rate_limit_per_second:
+                return False
+            self._windows[event] = (window_start, count + 1)
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler.
+
+    버린 레코드 수는 큐에 다시 넣을 수 있게 된 뒤 report_interval초마다, 그리고
+    종료 시 `logging.dropped` 레코드(WARNING, count 필드)로 보고합니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue, report_interval: float = DEFAULT_DROP_REPORT_INTERVAL):
+        super().__init__(log_queue)
+        self.report_interval = report_interval
+        self.dropped = 0  # 지금까지 버린 레코드 수
+        self._reported = 0  # 그중 보고한 수
+        self._last_report = time.monotonic()
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 안의 큐이므로 포맷은 리스너 스레드에서 수행
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+
+        if self.dropped > self._reported and time.monotonic() - self._last_report >= self.report_interval:
+            self.report_dropped(self.queue.put_nowait)
+
+    def report_dropped(self, emit: Callable[[logging.LogRecord], object]) -> None:
+        """
+        아직 보고하지 않은 버린 레코드 수를 `logging.dropped` 레코드로 내보냅니다.
+
+        Args:
+            emit: 레코드를 받을 함수 (큐의 put_nowait 또는 종료 시 출력 핸들러의 handle)
+        """
+        with self._lock:
+            count = self.dropped - self._reported
+            if count <= 0:
+                return
+            self._reported = self.dropped
+            self._last_report = time.monotonic()
+
+        record = logging.getLogger("app.logging").makeRecord(
+            "app.logging", logging.WARNING, __file__, 0, "logging.dropped", None, None,
+            extra={"count": count},
+        )
+        try:
+            emit(record)
+        except queue.Full:
+            # 다시 가득 찼으면 다음 보고에 합산
+            with self._lock:
+                self._reported -= count
+
+
+class DrainingQueueListener(QueueListener):
+    """종료 신호를 큐가 비워질 때까지 기다려 넣는 QueueListener (큐가 가득 찬 채 종료해도 실패하지 않음)"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(
+    level: str = "INFO",
+    sample_rates: Optional[dict[str, float]] = None,
+    rate_limit_per_second: int = DEFAULT_RATE_LIMIT_PER_SECOND,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> None:
+    """
+    `app` 로거에 구조화 로깅을 설정합니다 (여러 번 호출해도 한 번만 설정).
+
+    요청 스레드는 큐에 레코드를 넣기만 하고, JSON 포맷과 stdout 쓰기는
+    별도 리스너 스레드에서 처리합니다.
+
+    Args:
+        level: 로그 레벨 (예: "INFO", "DEBUG")
+        sample_rates: 이벤트별 샘플링 비율 (기본: DEFAULT_SAMPLE_RATES)
+        rate_limit_per_second: 이벤트별 초당 최대 기록 수
+        queue_size: 로그 큐 크기
+    """
+    global _listener
+
+    logger = logging.getLogger("app")
+    logger.setLevel(level.upper())
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(EventSampler(sample_rates, rate_limit_per_second))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    _listener = DrainingQueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    def shutdown() -> None:
+        # 남은 레코드를 모두 출력한 뒤, 보고하지 못한 버린 레코드 수는 직접 출력
+        _listener.stop()
+        queue_handler.report_dropped(stream_handler.handle)
+
+    atexit.register(shutdown)
+
+    logger.addHandler(queue_handler)
+    logger.propagate = False
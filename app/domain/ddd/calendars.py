@@ -0,0 +1,383 @@
+from bisect import bisect_left
+from calendar import isleap
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import MAXYEAR, date
+from typing import Optional
+
+
+# 주말 마스크: weekday() 번호(월=0 ... 일=6)에 해당하는 비트가 1이면 휴무일
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+def weekmask(*weekdays: int) -> int:
+    """휴무 요일 목록을 7비트 주말 마스크로 변환합니다 (예: weekmask(SAT, SUN))."""
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+SAT_SUN = weekmask(SAT, SUN)
+FRI_SAT = weekmask(FRI, SAT)
+THU_FRI = weekmask(THU, FRI)
+
+
+def _weekend_bits(mask: int, first_day: date, length: int) -> int:
+    """first_day부터 length일 동안의 주말 비트열 (비트 i = first_day + i일)"""
+    # first_day의 요일을 비트 0으로 회전한 1주 패턴을 반복
+    start_weekday = first_day.weekday()
+    week_pattern = 0
+    for i in range(7):
+        if mask >> ((start_weekday + i) % 7) & 1:
+            week_pattern |= 1 << i
+
+    bits = 0
+    for offset in range(0, length, 7):
+        bits |= week_pattern << offset
+    return bits & ((1 << length) - 1)
+
+
+def _nth_set_bit(bits: int, n: int) -> int:
+    """bits에서 n번째(1부터) 켜진 비트의 위치 (하위 k비트의 개수를 이분 탐색)"""
+    low, high = 1, bits.bit_length()
+    while low < high:
+        middle = (low + high) // 2
+        if (bits & ((1 << middle) - 1)).bit_count() >= n:
+            high = middle
+        else:
+            low = middle + 1
+    return low - 1
+
+
+@dataclass(frozen=True)
+class CountryCalendar:
+    """국가별 영업일 규칙 (주말 마스크와 시행일별 주말 변경 이력)"""
+    country_code: str
+    weekmask: int = SAT_SUN  # 첫 변경 이전(또는 변경이 없을 때)의 주말 마스크
+    weekmask_changes: tuple[tuple[date, int], ...] = ()  # (시행일, 주말 마스크), 시행일 오름차순
+
+    def weekmask_on(self, check_date: date) -> int:
+        """해당 날짜에 적용되는 주말 마스크"""
+        mask = self.weekmask
+        for effective_from, changed_mask in self.weekmask_changes:
+            if effective_from > check_date:
+                break
+            mask = changed_mask
+        return mask
+
+    def weekend_bits(self, year: int) -> int:
+        """해당 연도의 주말 비트마스크 (비트 i = 1월 1일 + i일)"""
+        year_start = date(year, 1, 1)
+        year_end = date(year, 12, 31)
+        length = year_end.toordinal() - year_start.toordinal() + 1
+
+        # 연도 안에서 주말 규칙이 바뀌는 지점으로 구간을 나눔
+        boundaries = [year_start] + [
+            effective_from
+            for effective_from, _ in self.weekmask_changes
+            if year_start < effective_from <= year_end
+        ]
+
+        bits = 0
+        for index, segment_start in enumerate(boundaries):
+            segment_end = boundaries[index + 1] if index + 1 < len(boundaries) else None
+            offset = segment_start.toordinal() - year_start.toordinal()
+            segment_length = (segment_end.toordinal() - year_start.toordinal() if segment_end else length) - offset
+            bits |= _weekend_bits(self.weekmask_on(segment_start), segment_start, segment_length) << offset
+        return bits
+
+
+# 토/일 주말이 아닌 국가의 규칙
+# UAE: 2006-09-01 목/금 -> 금/토, 2022-01-01 금/토 -> 토/일
+# SA: 2013-06-29 목/금 -> 금/토
+COUNTRY_CALENDARS: dict[str, CountryCalendar] = {
+    "UAE": CountryCalendar(
+        country_code="UAE",
+        weekmask=THU_FRI,
+        weekmask_changes=((date(2006, 9, 1), FRI_SAT), (date(2022, 1, 1), SAT_SUN)),
+    ),
+    "SA": CountryCalendar(
+        country_code="SA",
+        weekmask=THU_FRI,
+        weekmask_changes=((date(2013, 6, 29), FRI_SAT),),
+    ),
+}
+
+
+def get_country_calendar(country_code: str) -> CountryCalendar:
+    """국가별 영업일 규칙을 반환합니다 (등록되지 않은 국가는 토/일 주말)."""
+    code = country_code.upper()
+    return COUNTRY_CALENDARS.get(code) or CountryCalendar(country_code=code)
+
+
+class BusinessCalendar:
+    """
+    여러 국가의 영업일 규칙을 합친 달력.
+
+    연도마다 주말/공휴일을 비트마스크로 컴파일하고 국가 간에는 비트 OR로 병합하므로,
+    날짜 하나를 확인하는 데 비트 검사 한 번이면 됩니다. 공휴일은 계산이 새 연도에
+    진입할 때에만 로더로부터 가져옵니다.
+
+    n번째 영업일과 구간 안의 주말/공휴일 목록은 연도 단위 비트 연산으로 구하므로
+    날짜 단위 순회가 없습니다. 연도별 영업일 수의 누적합도 함께 유지하여 두 날짜
+    사이의 영업일 수를 바로 구할 수 있습니다 (BusinessDayIndex 참고).
+    """
+
+    def __init__(
+        self,
+        country_calendars: Sequence[CountryCalendar],
+        load_holidays: Callable[[int], dict[date, dict[str, str]]] | None = None,
+        skip_weekends: bool = True,
+        skip_holidays: bool = True,
+    ):
+        """
+        Args:
+            country_calendars: 병합할 국가별 영업일 규칙
+            load_holidays: 연도를 받아 {date: {country_code: holiday_name}}을 반환하는 로더
+            skip_weekends: 주말을 비영업일로 볼지 여부
+            skip_holidays: 공휴일을 비영업일로 볼지 여부
+        """
+        self.country_calendars = tuple(country_calendars)
+        self.skip_weekends = skip_weekends
+        self.skip_holidays = skip_holidays
+        self._load_holidays = load_holidays
+        # 연도별 컴파일 결과: {year: (주말 비트, 공휴일 비트, 비영업일 비트, 영업일 비트)}
+        self._years: dict[int, tuple[int, int, int, int]] = {}
+        # 연도별 1월 1일의 서수 (비트 위치 = 날짜 서수 - 1월 1일 서수)
+        self._year_starts: dict[int, int] = {}
+        self.names: dict[date, dict[str, str]] = {}
+        # 연도별 누적 영업일 수: _prefix[i] = _prefix_first_year부터 i개 연도의 영업일 수
+        self._prefix_first_year: Optional[int] = None
+        self._prefix: list[int] = [0]
+
+    @classmethod
+    def for_countries(
+        cls,
+        country_codes: Sequence[str],
+        load_holidays: Callable[[int], dict[date, dict[str, str]]] | None = None,
+        skip_weekends: bool = True,
+        skip_holidays: bool = True,
+    ) -> "BusinessCalendar":
+        """국가 코드 목록으로 병합 달력을 생성합니다."""
+        return cls(
+            [get_country_calendar(code) for code in country_codes] or [CountryCalendar("")],
+            load_holidays,
+            skip_weekends=skip_weekends,
+            skip_holidays=skip_holidays,
+        )
+
+    def ensure_year(self, year: int) -> tuple[int, int, int, int]:
+        """해당 연도를 아직 컴파일하지 않았다면 컴파일합니다."""
+        compiled = self._years.get(year)
+        if compiled is not None:
+            return compiled
+
+        year_start = date(year, 1, 1).toordinal()
+        length = 366 if isleap(year) else 365
+        weekend = 0
+        for country_calendar in self.country_calendars:
+            weekend |= country_calendar.weekend_bits(year)
+
+        holiday = 0
+        if self._load_holidays is not None:
+            for holiday_date, names in self._load_holidays(year).items():
+                holiday |= 1 << (holiday_date.toordinal() - year_start)
+                self.names.setdefault(holiday_date, {}).update(names)
+
+        off = (weekend if self.skip_weekends else 0) | (holiday if self.skip_holidays else 0)
+        business = ~off & ((1 << length) - 1)
+        compiled = (weekend, holiday, off, business)
+        self._year_starts[year] = year_start
+        self._years[year] = compiled
+        return compiled
+
+    def ensure_years(self, first_year: int, last_year: int) -> None:
+        """first_year ~ last_year를 컴파일하고, 누적 영업일 수에 포함되도록 앞뒤로 넓힙니다."""
+        if self._prefix_first_year is None:
+            self._prefix_first_year = first_year
+
+        if first_year < self._prefix_first_year:
+            # 앞쪽 연도를 추가하면 기존 누적값 전체가 그만큼 밀림
+            head = [0]
+            for year in range(first_year, self._prefix_first_year):
+                head.append(head[-1] + self.ensure_year(year)[3].bit_count())
+            self._prefix = head[:-1] + [head[-1] + count for count in self._prefix]
+            self._prefix_first_year = first_year
+
+        next_year = self._prefix_first_year + len(self._prefix) - 1
+        for year in range(next_year, last_year + 1):
+            self._prefix.append(self._prefix[-1] + self.ensure_year(year)[3].bit_count())
+
+    def business_day_rank(self, check_date: date) -> int:
+        """
+        누적 영업일 수 기준 연도 1월 1일부터 check_date까지(포함)의 영업일 수.
+
+        기준 연도는 누적 범위가 앞으로 넓어지면 바뀌므로, 같은 호출 안에서 구한
+        값끼리만 비교해야 합니다.
+        """
+        year = check_date.year
+        self.ensure_years(year, year)
+        business = self.ensure_year(year)[3]
+        day_of_year = check_date.toordinal() - self._year_starts[year] + 1
+        return self._prefix[year - self._prefix_first_year] + (business & ((1 << day_of_year) - 1)).bit_count()
+
+    def date_of_business_rank(self, rank: int) -> Optional[date]:
+        """
+        business_day_rank가 rank인 영업일을 반환합니다 (누적 범위를 벗어나면 None).
+
+        연도는 누적합을 이분 탐색하여 찾고, 연도 안의 날짜는 영업일 비트의
+        하위 k비트 개수를 이분 탐색하여 찾습니다.
+        """
+        if rank <= 0 or rank > self._prefix[-1]:
+            return None
+        index = bisect_left(self._prefix, rank) - 1
+        year = self._prefix_first_year + index
+        remaining = rank - self._prefix[index]
+        business = self.ensure_year(year)[3]
+        return date.fromordinal(self._year_starts[year] + _nth_set_bit(business, remaining))
+
+    def _business_bits(self, year: int, skip_weekends: bool, skip_holidays: bool) -> int:
+        """해당 연도의 영업일 비트 (달력 설정과 다른 제외 조합이면 그 조합으로 다시 계산)"""
+        weekend, holiday, _, business = self.ensure_year(year)
+        if (skip_weekends, skip_holidays) == (self.skip_weekends, self.skip_holidays):
+            return business
+        off = (weekend if skip_weekends else 0) | (holiday if skip_holidays else 0)
+        return ~off & ((1 << (366 if isleap(year) else 365)) - 1)
+
+    def nth_business_day_after(
+        self,
+        start_date: date,
+        days: int,
+        skip_weekends: Optional[bool] = None,
+        skip_holidays: Optional[bool] = None,
+    ) -> date:
+        """
+        start_date 이후 days번째 영업일을 반환합니다 (0 이하이면 start_date).
+
+        연도마다 영업일 비트 개수를 빼 나가며 목표 연도를 찾고, 그 연도 안에서만
+        이분 탐색하므로 비용은 지나는 연도 수에 비례합니다.
+
+        Args:
+            start_date: 시작 날짜 (세지 않음)
+            days: 더할 영업일 수
+            skip_weekends: 주말 제외 여부 (None이면 달력 설정)
+            skip_holidays: 공휴일 제외 여부 (None이면 달력 설정)
+
+        Raises:
+            OverflowError: 9999-12-31까지 영업일이 모자라는 경우
+        """
+        if days <= 0:
+            return start_date
+        skip_weekends = self.skip_weekends if skip_weekends is None else skip_weekends
+        skip_holidays = self.skip_holidays if skip_holidays is None else skip_holidays
+
+        year = start_date.year
+        bits = self._business_bits(year, skip_weekends, skip_holidays)
+        # 시작일까지의 비트는 버림
+        offset = start_date.toordinal() - self._year_starts[year] + 1
+        bits = bits >> offset << offset
+        remaining = days
+        while True:
+            count = bits.bit_count()
+            if count >= remaining:
+                return date.fromordinal(self._year_starts[year] + _nth_set_bit(bits, remaining))
+            remaining -= count
+            year += 1
+            if year > MAXYEAR:
+                raise OverflowError("date value out of range")
+            bits = self._business_bits(year, skip_weekends, skip_holidays)
+
+    def _dates_with_bit(self, after: date, until: date, index: int) -> list[date]:
+        """(after, until] 구간에서 index번 비트열의 비트가 켜진 날짜 목록 (오름차순)"""
+        dates: list[date] = []
+        for year in range(after.year, until.year + 1):
+            bits = self.ensure_year(year)[index]
+            year_start = self._year_starts[year]
+            if year == after.year:
+                offset = after.toordinal() - year_start + 1
+                bits = bits >> offset << offset
+            if year == until.year:
+                bits &= (1 << (until.toordinal() - year_start + 1)) - 1
+            while bits:
+                lowest = bits & -bits
+                dates.append(date.fromordinal(year_start + lowest.bit_length() - 1))
+                bits ^= lowest
+        return dates
+
+    def weekends_between(self, after: date, until: date) -> list[date]:
+        """(after, until] 구간의 주말 목록 (skip_weekends와 무관)"""
+        return self._dates_with_bit(after, until, 0)
+
+    def holidays_between(self, after: date, until: date) -> list[date]:
+        """(after, until] 구간의 공휴일 목록 (skip_holidays와 무관)"""
+        return self._dates_with_bit(after, until, 1)
+
+    def _bit(self, check_date: date, index: int) -> bool:
+        year = check_date.year
+        bits = self.ensure_year(year)[index]
+        return bool(bits >> (check_date.toordinal() - self._year_starts[year]) & 1)
+
+    def is_weekend(self, check_date: date) -> bool:
+        """병합된 주말 규칙상 휴무일인지 (skip_weekends와 무관)"""
+        return self._bit(check_date, 0)
+
+    def is_holiday(self, check_date: date) -> bool:
+        """공휴일인지 (skip_holidays와 무관)"""
+        return self._bit(check_date, 1)
+
+    def is_business_day(self, check_date: date) -> bool:
+        """skip_weekends/skip_holidays 설정을 반영한 영업일 여부"""
+        return not self._bit(check_date, 2)
+
+    @property
+    def loaded_years(self) -> frozenset[int]:
+        """지금까지 컴파일된 연도 목록"""
+        return frozenset(self._years)
+
+
+class BusinessDayIndex:
+    """
+    [start, end] 구간의 영업일 색인.
+
+    달력의 연도별 누적 영업일 수를 사용하므로 만드는 비용은 구간의 연도 수에 비례하고,
+    두 날짜 사이의 영업일 수는 비트 개수 세기로, 특정 날짜로부터 n번째 영업일은
+    연도 누적합과 연도 내 비트에 대한 이분 탐색으로 구합니다.
+    """
+
+    def __init__(self, calendar: BusinessCalendar, start: date, end: date):
+        """
+        Args:
+            calendar: 영업일 달력 (skip_weekends/skip_holidays 설정 반영)
+            start: 구간 시작일
+            end: 구간 종료일
+        """
+        self.calendar = calendar
+        self.start = start
+        self.end = end
+        calendar.ensure_years(start.year, end.year)
+
+    def _check(self, check_date: date) -> None:
+        if not self.start <= check_date <= self.end:
+            raise ValueError(f"{check_date} is outside the indexed range {self.start}..{self.end}")
+
+    def count_business_days(self, after: date, until: date) -> int:
+        """(after, until] 구간의 영업일 수"""
+        self._check(after)
+        self._check(until)
+        return self.calendar.business_day_rank(until) - self.calendar.business_day_rank(after)
+
+    def add_business_days(self, start_date: date, days: int) -> date | None:
+        """
+        start_date 이후 days번째 영업일을 반환합니다 (0 이하이면 start_date).
+
+        Returns:
+            계산된 날짜 (색인 구간을 벗어나면 None)
+        """
+        self._check(start_date)
+        if days <= 0:
+            return start_date
+        found = self.calendar.date_of_business_rank(self.calendar.business_day_rank(start_date) + days)
+        if found is None or found > self.end:
+            return None
+        return found
@@ -11,6 +11,22 @@ class DueDateResult:
     holiday_names: dict[date, dict[str, str]] | None = None  # 공휴일 이름 매핑 {date: {country_code: holiday_name}}
 
 
+@dataclass(frozen=True)
+class DeliveryWindow:
+    """역산 결과: 지급기일이 목표일 이내가 되는 배송일 범위"""
+    window_start: date  # 탐색한 가장 이른 배송일
+    latest_delivery_date: date | None  # 가장 늦은 배송일 (없으면 None)
+    due_date: date | None  # latest_delivery_date의 지급기일
+
+
+@dataclass(frozen=True)
+class DaysWindow:
+    """역산 결과: 지급기일이 목표일 이내가 되는 DDD 일수 범위"""
+    min_days: int  # 가장 작은 일수 (공급당일 포함 시 1)
+    max_days: int | None  # 가장 큰 일수 (없으면 None)
+    due_date: date | None  # max_days의 지급기일
+
+
 @dataclass(frozen=True)
 class PaymentTerm:
     kind: str  # e.g., "DDD", "COD", "CIA"
@@ -1,21 +1,23 @@
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import date, timedelta
 
+from app.domain.ddd.calendars import SAT_SUN, BusinessCalendar
+
 
 class DateCalculator:
     """날짜 계산을 위한 도메인 서비스"""
 
     @staticmethod
-    def is_weekend(check_date: date) -> bool:
-        """주말 여부 확인 (토요일=5, 일요일=6)"""
-        return check_date.weekday() in (5, 6)
+    def is_weekend(check_date: date, weekend_mask: int = SAT_SUN) -> bool:
+        """주말 여부 확인 (기본: 토요일=5, 일요일=6)"""
+        return bool(weekend_mask >> check_date.weekday() & 1)
 
     @staticmethod
     def add_business_days(
         start_date: date,
         days: int,
-        skip_weekends: bool = True,
-        skip_holidays: bool = True,
-        holidays: set[date] | None = None,
+        calendar: BusinessCalendar,
     ) -> tuple[date, list[date], list[date]]:
         """
         영업일 기준으로 날짜를 더합니다.
@@ -23,74 +25,80 @@ class DateCalculator:
         Args:
             start_date: 시작 날짜
             days: 더할 일수
-            skip_weekends: 주말 제외 여부
-            skip_holidays: 공휴일 제외 여부
-            holidays: 공휴일 집합
+            calendar: 영업일 달력 (주말/공휴일 제외 여부 포함)
 
         Returns:
             (계산된 날짜, 제외된 주말 목록, 제외된 공휴일 목록)
         """
-        if holidays is None:
-            holidays = set()
-
-        current_date = start_date
-        days_added = 0
-        excluded_weekends: list[date] = []
-        excluded_holidays: list[date] = []
+        if days <= 0:
+            return start_date, [], []
 
-        while days_added < days:
-            current_date += timedelta(days=1)
+        due_date = calendar.nth_business_day_after(start_date, days)
 
-            # 주말과 공휴일 체크
-            is_valid_day = True
+        # 지나친 비영업일 중 제외 설정에 해당하는 주말/공휴일
+        excluded_weekends = calendar.weekends_between(start_date, due_date) if calendar.skip_weekends else []
+        excluded_holidays = calendar.holidays_between(start_date, due_date) if calendar.skip_holidays else []
+        return due_date, excluded_weekends, excluded_holidays
 
-            if skip_weekends and DateCalculator.is_weekend(current_date):
-                is_valid_day = False
-                excluded_weekends.append(current_date)
+    @staticmethod
+    def add_business_days_variants(
+        start_date: date,
+        targets: Iterable[tuple[int, bool, bool]],
+        calendar: BusinessCalendar,
+    ) -> dict[tuple[int, bool, bool], tuple[date, list[date], list[date]]]:
+        """
+        여러 (일수, 주말 제외, 공휴일 제외) 조합의 영업일 덧셈을 함께 계산합니다.
 
-            if skip_holidays and current_date in holidays:
-                is_valid_day = False
-                excluded_holidays.append(current_date)
+        조합마다 연도 단위 비트 연산으로 계산된 날짜를 구하고, 주말/공휴일 목록은 가장 늦은
+        계산된 날짜까지 한 번만 만든 뒤 조합별로 잘라 씁니다. 달력의 skip_weekends/skip_holidays
+        설정은 사용하지 않습니다.
 
-            # 유효한 날짜인 경우에만 카운트 증가
-            if is_valid_day:
-                days_added += 1
+        Args:
+            start_date: 시작 날짜
+            targets: (더할 일수, 주말 제외 여부, 공휴일 제외 여부) 목록
+            calendar: 영업일 달력
 
-        return current_date, excluded_weekends, excluded_holidays
+        Returns:
+            {(일수, 주말 제외, 공휴일 제외): (계산된 날짜, 제외된 주말 목록, 제외된 공휴일 목록)}
+        """
+        reached = {
+            target: calendar.nth_business_day_after(start_date, *target)
+            for target in set(targets)
+        }
+        if not reached:
+            return {}
+
+        last_due_date = max(reached.values())
+        weekends = calendar.weekends_between(start_date, last_due_date)
+        holidays = calendar.holidays_between(start_date, last_due_date)
+
+        results = {}
+        for target, due_date in reached.items():
+            _, skip_weekends, skip_holidays = target
+            results[target] = (
+                due_date,
+                weekends[:bisect_right(weekends, due_date)] if skip_weekends else [],
+                holidays[:bisect_right(holidays, due_date)] if skip_holidays else [],
+            )
+        return results
 
     @staticmethod
     def get_next_business_day(
         check_date: date,
-        skip_weekends: bool = True,
-        skip_holidays: bool = True,
-        holidays: set[date] | None = None,
+        calendar: BusinessCalendar,
     ) -> date:
         """
         다음 영업일을 반환합니다.
 
         Args:
             check_date: 확인할 날짜
-            skip_weekends: 주말 제외 여부
-            skip_holidays: 공휴일 제외 여부
-            holidays: 공휴일 집합
+            calendar: 영업일 달력 (주말/공휴일 제외 여부 포함)
 
         Returns:
             다음 영업일
         """
-        if holidays is None:
-            holidays = set()
-
         next_day = check_date
         while True:
             next_day += timedelta(days=1)
-
-            is_valid_day = True
-
-            if skip_weekends and DateCalculator.is_weekend(next_day):
-                is_valid_day = False
-
-            if skip_holidays and next_day in holidays:
-                is_valid_day = False
-
-            if is_valid_day:
+            if calendar.is_business_day(next_day):
                 return next_day
@@ -1,7 +1,10 @@
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 import json
+import logging
 import os
+import threading
+import time
 from pathlib import Path
 
 from googleapiclient.discovery import build
@@ -10,6 +13,69 @@ from googleapiclient.errors import HttpError
 from app.infrastructure.holiday_provider import HolidayProvider
 
 
+logger = logging.getLogger(__name__)
+
+# 파일 캐시 항목의 출처 (번들에서 적재한 항목은 만료되지 않음)
+CACHE_SOURCE_API = "api"
+CACHE_SOURCE_BUNDLE = "bundle"
+
+
+class HolidayFetchError(RuntimeError):
+    """Google API 공휴일 조회가 실패한 경우"""
+
+
+class YearHolidayCache:
+    """
+    여러 공휴일 제공자 인스턴스가 공유하는 연도별 메모리 캐시 (스레드 안전).
+
+    같은 (국가, 연도)의 캐시 미스는 한 스레드만 조회·저장하고,
+    동시에 들어온 다른 스레드는 그 결과를 기다렸다가 사용합니다.
+    """
+
+    def __init__(self):
+        # {(country_code, year): {date: holiday_name}}
+        self._holidays: dict[tuple[str, int], dict[date, str]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, int], threading.Lock] = {}
+
+    def put(self, key: tuple[str, int], holidays: dict[date, str]) -> None:
+        """연도별 공휴일을 저장합니다."""
+        with self._lock:
+            self._holidays[key] = holidays
+
+    def get_or_load(
+        self,
+        key: tuple[str, int],
+        load: Callable[[], tuple[dict[date, str], str]],
+    ) -> tuple[dict[date, str], str]:
+        """
+        캐시된 공휴일을 반환하고, 없으면 load()로 가져와 저장합니다.
+        load()가 예외를 발생시키면 아무것도 저장하지 않고 예외를 그대로 전달합니다.
+
+        Args:
+            key: (country_code, year)
+            load: (공휴일, 캐시 계층)을 반환하는 로더
+
+        Returns:
+            (공휴일, 캐시 계층) — 메모리 캐시 적중 시 계층은 "memory"
+        """
+        holidays = self._holidays.get(key)
+        if holidays is not None:
+            return holidays, "memory"
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # 기다리는 동안 다른 스레드가 채웠을 수 있음
+            holidays = self._holidays.get(key)
+            if holidays is not None:
+                return holidays, "memory"
+            holidays, cache_tier = load()
+            self.put(key, holidays)
+            return holidays, cache_tier
+
+
 class GoogleCalendarHolidayProvider(HolidayProvider):
     """Google Calendar API를 사용하여 공휴일을 조회하는 구현체"""
 
@@ -63,16 +129,25 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
     # 캐시 만료 기간 (일주일)
     CACHE_EXPIRY_DAYS = 7
 
-    def __init__(self, api_key: str, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: Optional[str] = None,
+        memory_cache: Optional[YearHolidayCache] = None,
+        strict: bool = False,
+    ):
         """
         Args:
-            api_key: Google API Key
+            api_key: Google API Key (비어 있으면 캐시/번들만 사용하는 캐시 전용 모드)
             cache_dir: 캐시 파일을 저장할 디렉토리 경로 (기본값: .cache/holidays)
+            memory_cache: 연도별 메모리 캐시 (여러 인스턴스가 공유할 수 있음, 기본값: 인스턴스 전용)
+            strict: True이면 API 조회 실패 시 빈 결과 대신 HolidayFetchError 발생 (번들 내보내기용)
         """
         self.api_key = api_key
+        self.strict = strict
+        # API 클라이언트(httplib2 기반)는 스레드 안전하지 않으므로 인스턴스마다 따로 생성
         self._service = None
-        # 연도별 메모리 캐시: {(country_code, year): {date: holiday_name}}
-        self._cache: dict[tuple[str, int], dict[date, str]] = {}
+        self._memory_cache = memory_cache if memory_cache is not None else YearHolidayCache()
 
         # 캐시 디렉토리 설정
         if cache_dir is None:
@@ -104,13 +179,18 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
             with open(cache_file, "r", encoding="utf-8") as f:
                 cache_data = json.load(f)
 
-            # 캐시 만료 확인
+            # 캐시 만료 확인 (번들에서 적재한 항목과 다시 조회할 수 없는 캐시 전용 모드에서는 만료되지 않음)
             cached_time = datetime.fromisoformat(cache_data.get("timestamp", "1970-01-01T00:00:00"))
             now = datetime.now()
+            expires = bool(self.api_key) and cache_data.get("source", CACHE_SOURCE_API) != CACHE_SOURCE_BUNDLE
 
-            if (now - cached_time).days > self.CACHE_EXPIRY_DAYS:
+            if expires and (now - cached_time).days > self.CACHE_EXPIRY_DAYS:
                 # 만료된 캐시 파일 삭제
                 cache_file.unlink(missing_ok=True)
+                logger.info(
+                    "holiday.cache_load",
+                    extra={"country": country_code, "year": year, "cache_tier": "disk", "outcome": "expired"},
+                )
                 return None
 
             # 날짜 문자열을 date 객체로 변환
@@ -122,16 +202,32 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
             return holidays
 
         except (json.JSONDecodeError, ValueError, OSError) as e:
-            print(f"Error loading cache: {e}")
+            logger.warning(
+                "holiday.cache_load",
+                extra={
+                    "country": country_code,
+                    "year": year,
+                    "cache_tier": "disk",
+                    "outcome": "error",
+                    "error": str(e),
+                },
+            )
             return None
 
-    def _save_cache(self, country_code: str, year: int, holidays: dict[date, str]):
+    def _save_cache(
+        self,
+        country_code: str,
+        year: int,
+        holidays: dict[date, str],
+        source: str = CACHE_SOURCE_API,
+    ):
         """연도별 캐시를 파일에 저장합니다."""
         cache_file = self._get_cache_file_path(country_code, year)
 
         try:
             cache_data = {
                 "timestamp": datetime.now().isoformat(),
+                "source": source,
                 "holidays": {dt.isoformat(): name for dt, name in holidays.items()}
             }
 
@@ -139,11 +235,29 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
 
         except OSError as e:
-            print(f"Error saving cache: {e}")
+            logger.warning(
+                "holiday.cache_save",
+                extra={
+                    "country": country_code,
+                    "year": year,
+                    "cache_tier": "disk",
+                    "outcome": "error",
+                    "error": str(e),
+                },
+            )
 
-    def _fetch_year_holidays(self, country_code: str, year: int, calendar_id: str) -> dict[date, str]:
-        """특정 연도의 모든 공휴일을 Google API에서 가져옵니다."""
+    def _fetch_year_holidays(
+        self, country_code: str, year: int, calendar_id: str
+    ) -> dict[date, str]:
+        """
+        특정 연도의 모든 공휴일을 Google API에서 가져옵니다.
+
+        Raises:
+            HolidayFetchError: 조회가 실패한 경우
+        """
         holidays = {}
+        started_at = time.perf_counter()
+        log_fields = {"country": country_code, "year": year, "cache_tier": "upstream"}
 
         try:
             service = self._get_service()
@@ -155,13 +269,6 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
             time_min = datetime.combine(year_start, datetime.min.time()).isoformat() + "Z"
             time_max = datetime.combine(year_end, datetime.max.time()).isoformat() + "Z"
 
-            # API 요청 정보 로깅
-            api_url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
-            print(f"[Google Calendar API Request]")
-            print(f"  Method: GET")
-            print(f"  URL: {api_url}")
-            print(f"  Params: timeMin={time_min}, timeMax={time_max}, singleEvents=True, orderBy=startTime")
-
             events_result = (
                 service.events()
                 .list(
@@ -189,10 +296,67 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
                         holidays[holiday_date] = holiday_name
 
         except HttpError as error:
-            print(f"Google Calendar API error: {error}")
-
+            logger.warning(
+                "holiday.fetch",
+                extra={
+                    **log_fields,
+                    "latency_ms": round((time.perf_counter() - started_at) * 1000, 1),
+                    "outcome": "error",
+                    "error": str(error),
+                },
+            )
+            raise HolidayFetchError(f"Failed to fetch {country_code} {year} holidays: {error}") from error
+
+        logger.info(
+            "holiday.fetch",
+            extra={
+                **log_fields,
+                "latency_ms": round((time.perf_counter() - started_at) * 1000, 1),
+                "outcome": "ok",
+                "count": len(holidays),
+            },
+        )
         return holidays
 
+    def _load_year(self, country_code: str, year: int, calendar_id: str) -> tuple[dict[date, str], str]:
+        """메모리 캐시 미스 시 파일 캐시 또는 API에서 연도별 공휴일을 가져옵니다."""
+        year_holidays = self._load_cache(country_code, year)
+        if year_holidays is not None:
+            return year_holidays, "disk"
+
+        if not self.api_key:
+            # 캐시 전용 모드 (번들만 사용): 외부 API를 호출하지 않음
+            logger.warning(
+                "holiday.fetch",
+                extra={"country": country_code, "year": year, "cache_tier": "upstream", "outcome": "no_api_key"},
+            )
+            raise HolidayFetchError(f"No cached holidays for {country_code} {year} and no API key configured")
+
+        # 캐시가 없으면 API에서 가져오기 (실패 시 HolidayFetchError, 어느 캐시에도 저장하지 않음)
+        year_holidays = self._fetch_year_holidays(country_code, year, calendar_id)
+
+        # 파일 캐시에 저장
+        self._save_cache(country_code, year, year_holidays)
+        return year_holidays, "upstream"
+
+    def seed_holidays(self, holidays: dict[tuple[str, int], dict[date, str]]) -> int:
+        """
+        미리 준비된 연도별 공휴일을 메모리 캐시와 파일 캐시에 적재합니다 (API 호출 없음).
+
+        번들에서 적재한 파일 캐시 항목은 만료되지 않으므로, 외부망이 없는 노드도
+        CACHE_EXPIRY_DAYS 이후 Google API로 되돌아가지 않습니다.
+
+        Args:
+            holidays: 연도별 공휴일 {(country_code, year): {date: holiday_name}}
+
+        Returns:
+            적재한 (국가, 연도) 수
+        """
+        for (country_code, year), year_holidays in holidays.items():
+            self._memory_cache.put((country_code, year), year_holidays)
+            self._save_cache(country_code, year, year_holidays, source=CACHE_SOURCE_BUNDLE)
+        return len(holidays)
+
     def get_holidays(
         self, country_code: str, start_date: date, end_date: date
     ) -> dict[date, str]:
@@ -223,24 +387,30 @@ class GoogleCalendarHolidayProvider(HolidayProvider):
         all_holidays: dict[date, str] = {}
 
         for year in sorted(years):
-            cache_key = (country_code, year)
-
-            # 메모리 캐시 확인
-            if cache_key in self._cache:
-                year_holidays = self._cache[cache_key]
-            else:
-                # 파일 캐시 확인
-                year_holidays = self._load_cache(country_code, year)
-
-                if year_holidays is None:
-                    # 캐시가 없으면 API에서 가져오기
-                    year_holidays = self._fetch_year_holidays(country_code, year, calendar_id)
-
-                    # 파일 캐시에 저장
-                    self._save_cache(country_code, year, year_holidays)
-
-                # 메모리 캐시에 저장
-                self._cache[cache_key] = year_holidays
+            # 메모리 캐시 → 파일 캐시 → API 순으로 조회
+            started_at = time.perf_counter()
+            try:
+                year_holidays, cache_tier = self._memory_cache.get_or_load(
+                    (country_code, year),
+                    lambda: self._load_year(country_code, year, calendar_id),
+                )
+                outcome = "ok"
+            except HolidayFetchError:
+                if self.strict:
+                    raise
+                # 실패한 조회는 캐시하지 않고 다음 조회 때 다시 시도
+                year_holidays, cache_tier, outcome = {}, "upstream", "error"
+
+            logger.info(
+                "holiday.lookup",
+                extra={
+                    "country": country_code,
+                    "year": year,
+                    "cache_tier": cache_tier,
+                    "latency_ms": round((time.perf_counter() - started_at) * 1000, 1),
+                    "outcome": outcome,
+                },
+            )
 
             # 결과에 병합
             all_holidays.update(year_holidays)
@@ -0,0 +1,112 @@
+import gzip
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Iterable
+
+from app.infrastructure.holiday_provider import HolidayProvider
+
+
+# 번들 파일 형식 식별자와 버전 (형식이 바뀌면 버전을 올림)
+BUNDLE_FORMAT = "ddd-holiday-bundle"
+BUNDLE_VERSION = 1
+
+
+class HolidayBundleError(ValueError):
+    """번들 파일 형식/버전/체크섬이 올바르지 않은 경우"""
+
+
+def _checksum(entries: list[dict]) -> str:
+    """항목 목록의 정규화된 JSON에 대한 SHA-256 체크섬"""
+    canonical = json.dumps(entries, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def export_bundle(
+    holiday_provider: HolidayProvider,
+    country_codes: Iterable[str],
+    years: Iterable[int],
+) -> bytes:
+    """
+    지정한 국가·연도의 공휴일을 하나의 번들(gzip 압축 JSON)로 내보냅니다.
+
+    Args:
+        holiday_provider: 공휴일 제공자 (캐시가 있으면 캐시에서, 없으면 원본에서 조회,
+            GoogleCalendarHolidayProvider는 strict=True로 생성)
+        country_codes: 국가 코드 목록
+        years: 연도 목록
+
+    Returns:
+        번들 파일 내용
+
+    Raises:
+        HolidayFetchError: 공휴일 조회가 실패한 경우 (빈 연도를 담은 번들을 만들지 않도록
+            조회 실패 시 예외를 발생시키는 제공자를 넘겨야 함)
+    """
+    entries = []
+    for country_code in sorted({c.upper() for c in country_codes}):
+        for year in sorted(set(years)):
+            holidays = holiday_provider.get_holidays(country_code, date(year, 1, 1), date(year, 12, 31))
+            entries.append({
+                "country": country_code,
+                "year": year,
+                "holidays": {dt.isoformat(): name for dt, name in sorted(holidays.items())},
+            })
+
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "checksum": _checksum(entries),
+        "entries": entries,
+    }
+    return gzip.compress(json.dumps(bundle, ensure_ascii=False).encode("utf-8"), mtime=0)
+
+
+def read_bundle(data: bytes) -> dict[tuple[str, int], dict[date, str]]:
+    """
+    번들 파일을 검증하고 연도별 공휴일로 변환합니다.
+
+    Args:
+        data: 번들 파일 내용
+
+    Returns:
+        연도별 공휴일 {(country_code, year): {date: holiday_name}}
+
+    Raises:
+        HolidayBundleError: 형식, 버전 또는 체크섬이 맞지 않는 경우
+    """
+    try:
+        bundle = json.loads(gzip.decompress(data).decode("utf-8"))
+    except (OSError, EOFError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise HolidayBundleError(f"Unreadable holiday bundle: {e}") from e
+
+    if not isinstance(bundle, dict) or bundle.get("format") != BUNDLE_FORMAT:
+        raise HolidayBundleError("Not a holiday bundle")
+    if bundle.get("version") != BUNDLE_VERSION:
+        raise HolidayBundleError(f"Unsupported holiday bundle version: {bundle.get('version')}")
+
+    entries = bundle.get("entries", [])
+    if _checksum(entries) != bundle.get("checksum"):
+        raise HolidayBundleError("Holiday bundle checksum mismatch")
+
+    if not isinstance(entries, list):
+        raise HolidayBundleError("Malformed holiday bundle: 'entries' must be a list")
+
+    holidays: dict[tuple[str, int], dict[date, str]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise HolidayBundleError("Malformed holiday bundle entry: entry must be an object")
+        country, year, year_holidays = entry.get("country"), entry.get("year"), entry.get("holidays")
+        if not isinstance(country, str) or not isinstance(year, int) or not isinstance(year_holidays, dict):
+            raise HolidayBundleError(
+                "Malformed holiday bundle entry: expected 'country' (string), 'year' (integer) "
+                "and 'holidays' (object)"
+            )
+        try:
+            holidays[(country, year)] = {
+                date.fromisoformat(date_str): str(name) for date_str, name in year_holidays.items()
+            }
+        except (TypeError, ValueError) as e:
+            raise HolidayBundleError(f"Malformed holiday bundle entry: {e}") from e
+    return holidays
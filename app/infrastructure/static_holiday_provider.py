@@ -0,0 +1,70 @@
+from datetime import date
+
+from app.infrastructure.holiday_provider import HolidayProvider
+
+
+class MissingHolidayYearError(LookupError):
+    """스냅샷에 포함되지 않은 (국가, 연도)를 조회한 경우"""
+
+    def __init__(self, country_code: str, year: int):
+        super().__init__(f"Holiday snapshot has no data for {country_code} {year}")
+        self.country_code = country_code
+        self.year = year
+
+
+class StaticHolidayProvider(HolidayProvider):
+    """
+    미리 로드된 연도별 공휴일 스냅샷으로 응답하는 읽기 전용 구현체.
+
+    외부 API를 호출하지 않으므로 작업 프로세스 간에 그대로 공유할 수 있습니다.
+    """
+
+    def __init__(self, holidays: dict[tuple[str, int], dict[date, str]], strict: bool = True):
+        """
+        Args:
+            holidays: 연도별 공휴일 {(country_code, year): {date: holiday_name}}
+            strict: True면 스냅샷에 없는 연도 조회 시 MissingHolidayYearError 발생,
+                False면 빈 결과로 간주
+        """
+        self._holidays = holidays
+        self.strict = strict
+
+    def get_holidays(
+        self, country_code: str, start_date: date, end_date: date
+    ) -> dict[date, str]:
+        """
+        특정 기간의 공휴일 목록을 조회합니다.
+
+        Args:
+            country_code: 국가 코드 (예: 'KR', 'US', 'SG')
+            start_date: 조회 시작일
+            end_date: 조회 종료일
+
+        Returns:
+            공휴일 날짜와 이름의 딕셔너리 {date: holiday_name}
+        """
+        result: dict[date, str] = {}
+        for year in range(start_date.year, end_date.year + 1):
+            year_holidays = self._holidays.get((country_code, year))
+            if year_holidays is None:
+                if self.strict:
+                    raise MissingHolidayYearError(country_code, year)
+                continue
+            result.update(
+                {dt: name for dt, name in year_holidays.items() if start_date <= dt <= end_date}
+            )
+        return result
+
+    def is_holiday(self, country_code: str, check_date: date) -> bool:
+        """
+        특정 날짜가 공휴일인지 확인합니다.
+
+        Args:
+            country_code: 국가 코드
+            check_date: 확인할 날짜
+
+        Returns:
+            공휴일 여부
+        """
+        holidays = self.get_holidays(country_code, check_date, check_date)
+        return check_date in holidays
@@ -1,23 +1,58 @@
+import logging
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
+from app.api.deps import get_holiday_provider
+from app.api.v1.routers import admin as admin_router
 from app.api.v1.routers import health as health_router
 from app.api.v1.routers import calculate as calculate_router
-from app.core.config import get_settings
+from app.core.config import AppSettings, get_settings
+from app.core.logging_config import configure_logging
+from app.infrastructure.holiday_bundle import HolidayBundleError, read_bundle
 from app.web import routers as web_pages
+from app.web.assets import AssetStaticFiles
+
+
+logger = logging.getLogger(__name__)
+
+
+def load_holiday_bundle(settings: AppSettings) -> None:
+    """
+    설정된 공휴일 번들을 공유 공휴일 제공자에 적재합니다 (외부 API 호출 없이 warm start).
+
+    API Key가 없어도 번들이 설정되면 캐시 전용 제공자가 사용되며, 번들을 읽을 수 없으면
+    공휴일 없이 서비스하지 않도록 시작을 중단합니다.
+    """
+    if not settings.holiday_bundle_path:
+        return
+    holiday_provider = get_holiday_provider(settings)
+    try:
+        with open(settings.holiday_bundle_path, "rb") as f:
+            holidays = read_bundle(f.read())
+    except (OSError, HolidayBundleError) as e:
+        raise RuntimeError(f"Cannot load HOLIDAY_BUNDLE_PATH={settings.holiday_bundle_path}: {e}") from e
+    imported = holiday_provider.seed_holidays(holidays)
+    logger.info(
+        "holiday.bundle_load",
+        extra={"count": imported, "outcome": "ok" if settings.google_cal_api_key else "cache_only"},
+    )
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
+    configure_logging(settings.log_level)
     app = FastAPI(title=settings.app_name, debug=settings.debug)
 
     api_prefix = settings.api_prefix.rstrip("/")
     app.include_router(health_router.router, prefix=api_prefix)
     app.include_router(calculate_router.router, prefix=api_prefix)
+    app.include_router(admin_router.router, prefix=api_prefix)
+
+    load_holiday_bundle(settings)
 
     # Web UI
     app.include_router(web_pages.router)
-    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+    app.mount("/static", AssetStaticFiles(directory="app/static"), name="static")
 
     return app
 
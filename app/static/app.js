@@ -14,7 +14,7 @@ async function calculateDDD(formData) {
 
   if (!response.ok) {
     const errorData = await response.json();
-    throw new Error(errorData.detail || 'API request failed');
+    throw new Error(errorData.detail?.message || errorData.detail || 'API request failed');
   }
 
   return await response.json();
@@ -1,9 +1,149 @@
+from collections.abc import Callable
 from datetime import date, timedelta
 from typing import Optional
 
-from app.domain.ddd.entities import DeliveryInfo, PaymentTerm, DueDateResult
+from app.domain.ddd.entities import (
+    DaysWindow,
+    DeliveryInfo,
+    DeliveryWindow,
+    DueDateResult,
+    PaymentTerm,
+)
+from app.domain.ddd.calendars import BusinessCalendar, BusinessDayIndex
 from app.domain.ddd.services import DateCalculator
 from app.infrastructure.holiday_provider import HolidayProvider
+from app.use_cases.estimate_cost import (
+    BudgetExceededError,
+    WorkBudget,
+    estimate_cost,
+    estimate_range_cost,
+)
+
+
+# 결제일 조정(adjust_to_weekday)으로 목표일 이후의 결제일이 목표일 이내로 당겨질 수 있는
+# 최대 일수 (연속된 주말/공휴일 길이의 상한)
+ADJUST_LOOKAHEAD_DAYS = 31
+
+# 배송일 역산 시 탐색 구간을 넓히는 최대 횟수 (매번 2배)
+MAX_WINDOW_EXPANSIONS = 4
+
+
+def _make_year_loader(
+    holiday_provider: HolidayProvider,
+    country_codes: list[str],
+) -> Callable[[int], dict[date, dict[str, str]]]:
+    """여러 국가의 공휴일을 연도 단위로 병합하여 반환하는 로더를 생성합니다."""
+
+    def load_year(year: int) -> dict[date, dict[str, str]]:
+        merged: dict[date, dict[str, str]] = {}
+        for country_code in country_codes:
+            country_holidays = holiday_provider.get_holidays(
+                country_code, date(year, 1, 1), date(year, 12, 31)
+            )
+            # 각 공휴일에 대해 국가 코드와 함께 저장
+            for holiday_date, holiday_name in country_holidays.items():
+                merged.setdefault(holiday_date, {})[country_code] = holiday_name
+        return merged
+
+    return load_year
+
+
+def _end_of_month(value: date) -> date:
+    """해당 월의 말일을 반환합니다."""
+    if value.month == 12:
+        # 9999-12에서 다음 달로 넘어가지 않도록 12월은 바로 반환
+        return value.replace(day=31)
+    next_month = value.replace(day=28) + timedelta(days=4)
+    return next_month - timedelta(days=next_month.day)
+
+
+def _build_calendar(
+    delivery: DeliveryInfo,
+    holiday_provider: Optional[HolidayProvider],
+    skip_weekends: bool = True,
+    skip_holidays: bool = True,
+) -> BusinessCalendar:
+    """국가별 주말 규칙과 공휴일을 병합한 영업일 달력을 생성합니다."""
+    # 공휴일은 날짜 커서가 새 연도에 진입할 때에만 가져옴 (달력 표시를 위해 항상 로드)
+    load_holidays = None
+    if holiday_provider is not None:
+        load_holidays = _make_year_loader(holiday_provider, delivery.country_codes)
+    calendar = BusinessCalendar.for_countries(
+        delivery.country_codes,
+        load_holidays,
+        skip_weekends=skip_weekends,
+        skip_holidays=skip_holidays,
+    )
+    # 달력 표시를 위해 배송일이 속한 연도는 미리 로드
+    calendar.ensure_year(delivery.delivery_date.year)
+    return calendar
+
+
+def _shift_date(value: date, days: int) -> date:
+    """value에서 days일 이동한 날짜 (지원 범위 0001-01-01 ~ 9999-12-31을 넘으면 경계로 제한)"""
+    ordinal = value.toordinal() + days
+    return date.fromordinal(min(max(ordinal, date.min.toordinal()), date.max.toordinal()))
+
+
+def _check_window_budget(
+    budget: Optional[WorkBudget],
+    window_start: date,
+    window_end: date,
+    countries: int,
+) -> None:
+    """색인할 구간의 작업량이 예산을 넘으면 BudgetExceededError를 발생시킵니다."""
+    if budget is None:
+        return
+    cost = estimate_range_cost(window_start, window_end, countries)
+    if not budget.allows(cost):
+        raise BudgetExceededError("Inverse search window exceeds the per-request work budget", cost)
+
+
+def _effective_days(term: PaymentTerm) -> int:
+    """공급당일을 1DDD로 포함하는 경우, days를 1 감소"""
+    return term.days - 1 if term.include_delivery_as_day_one else term.days
+
+
+def _previous_weekday(due_date: date, calendar: BusinessCalendar) -> date:
+    """주말/공휴일이 아닌 날이 나올 때까지 하루씩 앞당깁니다."""
+    while due_date > date.min and (calendar.is_weekend(due_date) or calendar.is_holiday(due_date)):
+        # 하루 전으로 이동
+        due_date = due_date - timedelta(days=1)
+    return due_date
+
+
+def _adjust_to_weekday(
+    due_date: date,
+    excluded_weekends: list[date],
+    excluded_holidays: list[date],
+    calendar: BusinessCalendar,
+) -> tuple[date, list[date], list[date]]:
+    """결제일이 주말/공휴일이면 이전 평일로 조정합니다."""
+    original_due_date = due_date
+    due_date = _previous_weekday(due_date, calendar)
+
+    # 조정으로 인해 지나친 주말/공휴일을 excluded 리스트에서 제거
+    # (조정 후 due_date가 원래 due_date보다 이전이면, 그 사이의 날짜들은 제외 대상이 아님)
+    if due_date < original_due_date:
+        excluded_weekends = [d for d in excluded_weekends if d < due_date or d > original_due_date]
+        excluded_holidays = [d for d in excluded_holidays if d < due_date or d > original_due_date]
+
+    return due_date, excluded_weekends, excluded_holidays
+
+
+def _holiday_names_in_view(
+    calendar: BusinessCalendar,
+    delivery_date: date,
+    due_dates: list[date],
+) -> dict[date, dict[str, str]]:
+    """달력 표시 범위(배송월 1일 ~ 결제월 말일)의 공휴일 이름만 반환합니다."""
+    display_start = min(delivery_date, *due_dates).replace(day=1)
+    display_end = _end_of_month(max(delivery_date, *due_dates))
+    return {
+        dt: names
+        for dt, names in sorted(calendar.names.items())
+        if display_start <= dt <= display_end
+    }
 
 
 def calculate_due_date(
@@ -26,58 +166,29 @@ def calculate_due_date(
         if term.days is None:
             raise ValueError("DDD term requires 'days'")
 
-        # 공급당일을 1DDD로 포함하는 경우, days를 1 감소
-        effective_days = term.days - 1 if term.include_delivery_as_day_one else term.days
-
-        # 공휴일 조회 (달력 표시를 위해 항상 로드)
-        holidays: set[date] = set()
-        holiday_names_map: dict[date, dict[str, str]] = {}
-        if holiday_provider is not None:
-            # 예상 기간보다 넉넉하게 조회 (최대 2배 기간)
-            # 주말/공휴일을 제외하므로 실제 소요 일수가 더 길 수 있음
-            max_days = effective_days * 2 + 30
-            end_date = delivery.delivery_date + timedelta(days=max_days)
-
-            # 여러 국가의 공휴일을 병합 (국가별로 추적)
-            for country_code in delivery.country_codes:
-                country_holidays = holiday_provider.get_holidays(
-                    country_code, delivery.delivery_date, end_date
-                )
-                holidays.update(country_holidays.keys())
-
-                # 각 공휴일에 대해 국가 코드와 함께 저장
-                for holiday_date, holiday_name in country_holidays.items():
-                    if holiday_date not in holiday_names_map:
-                        holiday_names_map[holiday_date] = {}
-                    holiday_names_map[holiday_date][country_code] = holiday_name
+        calendar = _build_calendar(
+            delivery,
+            holiday_provider,
+            skip_weekends=term.skip_weekends,
+            skip_holidays=term.skip_holidays,
+        )
 
         # 영업일 기준 날짜 계산
         due_date, excluded_weekends, excluded_holidays = DateCalculator.add_business_days(
             delivery.delivery_date,
-            effective_days,
-            skip_weekends=term.skip_weekends,
-            skip_holidays=term.skip_holidays,
-            holidays=holidays,
+            _effective_days(term),
+            calendar,
         )
 
         # 결제일이 주말/공휴일이면 이전 평일로 조정
         if term.adjust_to_weekday:
-            original_due_date = due_date
-            while True:
-                is_weekend = due_date.weekday() in (5, 6)  # Saturday=5, Sunday=6
-                is_holiday = due_date in holidays
-
-                if not is_weekend and not is_holiday:
-                    break
+            due_date, excluded_weekends, excluded_holidays = _adjust_to_weekday(
+                due_date, excluded_weekends, excluded_holidays, calendar
+            )
 
-                # 하루 전으로 이동
-                due_date = due_date - timedelta(days=1)
-
-            # 조정으로 인해 지나친 주말/공휴일을 excluded 리스트에서 제거
-            # (조정 후 due_date가 원래 due_date보다 이전이면, 그 사이의 날짜들은 제외 대상이 아님)
-            if due_date < original_due_date:
-                excluded_weekends = [d for d in excluded_weekends if d < due_date or d > original_due_date]
-                excluded_holidays = [d for d in excluded_holidays if d < due_date or d > original_due_date]
+        holiday_names_map: dict[date, dict[str, str]] = {}
+        if holiday_provider is not None:
+            holiday_names_map = _holiday_names_in_view(calendar, delivery.delivery_date, [due_date])
 
         return DueDateResult(
             due_date=due_date,
@@ -96,3 +207,251 @@ def calculate_due_date(
     else:
         raise ValueError(f"Unsupported payment term kind: {term.kind}")
 
+
+def calculate_due_date_variants(
+    delivery: DeliveryInfo,
+    terms: list[PaymentTerm],
+    holiday_provider: Optional[HolidayProvider] = None,
+) -> tuple[list[DueDateResult], dict[date, dict[str, str]]]:
+    """
+    하나의 배송에 대해 여러 지급 조건(옵션 조합)의 지급기일을 한 번에 계산합니다.
+
+    공휴일은 한 번만 로드하고, 모든 DDD 조건을 같은 달력 위에서 함께 계산합니다.
+
+    Args:
+        delivery: 배송 정보
+        terms: 지급 조건 목록
+        holiday_provider: 공휴일 제공자 (옵션)
+
+    Returns:
+        (조건 순서와 같은 계산 결과 목록, 모든 결과의 달력 표시 범위 공휴일 이름)
+    """
+    for term in terms:
+        if term.kind.upper() == "DDD" and term.days is None:
+            raise ValueError("DDD term requires 'days'")
+        if term.kind.upper() not in {"DDD", "COD", "CIA"}:
+            raise ValueError(f"Unsupported payment term kind: {term.kind}")
+
+    ddd_terms = [term for term in terms if term.kind.upper() == "DDD"]
+    calendar = _build_calendar(delivery, holiday_provider)
+
+    walked = DateCalculator.add_business_days_variants(
+        delivery.delivery_date,
+        [(max(_effective_days(term), 0), term.skip_weekends, term.skip_holidays) for term in ddd_terms],
+        calendar,
+    )
+
+    results: list[DueDateResult] = []
+    for term in terms:
+        if term.kind.upper() != "DDD":
+            # COD(Cash on Delivery), CIA(Cash in Advance): 배송일과 동일
+            results.append(DueDateResult(
+                due_date=delivery.delivery_date,
+                excluded_weekends=[],
+                excluded_holidays=[],
+            ))
+            continue
+
+        due_date, excluded_weekends, excluded_holidays = walked[
+            (max(_effective_days(term), 0), term.skip_weekends, term.skip_holidays)
+        ]
+        if term.adjust_to_weekday:
+            due_date, excluded_weekends, excluded_holidays = _adjust_to_weekday(
+                due_date, excluded_weekends, excluded_holidays, calendar
+            )
+        results.append(DueDateResult(
+            due_date=due_date,
+            excluded_weekends=excluded_weekends,
+            excluded_holidays=excluded_holidays,
+        ))
+
+    holiday_names_map: dict[date, dict[str, str]] = {}
+    if holiday_provider is not None and results:
+        holiday_names_map = _holiday_names_in_view(
+            calendar, delivery.delivery_date, [result.due_date for result in results]
+        )
+    return results, holiday_names_map
+
+
+def _require_ddd_days(term: PaymentTerm) -> None:
+    if term.kind.upper() != "DDD" or term.days is None:
+        raise ValueError("Inverse queries require a DDD term with 'days'")
+
+
+def _due_date_in_index(
+    index: BusinessDayIndex,
+    calendar: BusinessCalendar,
+    delivery_date: date,
+    effective_days: int,
+    adjust_to_weekday: bool,
+) -> Optional[date]:
+    """누적 영업일 색인으로 지급기일을 구합니다 (색인 구간을 벗어나면 None)."""
+    due_date = index.add_business_days(delivery_date, effective_days)
+    if due_date is not None and adjust_to_weekday:
+        due_date = _previous_weekday(due_date, calendar)
+    return due_date
+
+
+def solve_latest_delivery_date(
+    country_codes: list[str],
+    term: PaymentTerm,
+    target_due_date: date,
+    holiday_provider: Optional[HolidayProvider] = None,
+    earliest_delivery_date: Optional[date] = None,
+    budget: Optional[WorkBudget] = None,
+) -> DeliveryWindow:
+    """
+    지급기일이 목표일 이내가 되는 가장 늦은 배송일을 역산합니다.
+
+    지급기일은 배송일에 대해 단조 증가하므로, 누적 영업일 색인 위에서
+    배송일을 이분 탐색합니다 (각 후보의 지급기일도 색인에서 연도·비트 이분 탐색으로 구함).
+
+    Args:
+        country_codes: 국가 코드 목록
+        term: DDD 지급 조건 (days 필수)
+        target_due_date: 목표 지급기일
+        holiday_provider: 공휴일 제공자 (옵션)
+        earliest_delivery_date: 탐색할 가장 이른 배송일 (생략하면 일수로부터 추정)
+        budget: 작업량 예산 (탐색 구간을 넓힐 때마다 다시 확인)
+
+    Returns:
+        가능한 배송일 범위 (window_start ~ latest_delivery_date)
+
+    Raises:
+        BudgetExceededError: 탐색 구간이 예산을 넘는 경우
+    """
+    _require_ddd_days(term)
+    effective_days = max(_effective_days(term), 0)
+    countries = len(country_codes) if holiday_provider is not None else 0
+
+    # 조정 없이 일수가 0이면 배송일 = 지급기일이므로, 조정이 있을 때만 목표일 이후 배송일이 가능
+    lookahead = ADJUST_LOOKAHEAD_DAYS if term.adjust_to_weekday else 0
+    latest_candidate = _shift_date(target_due_date, lookahead)
+    if earliest_delivery_date is not None and earliest_delivery_date > latest_candidate:
+        return DeliveryWindow(window_start=earliest_delivery_date, latest_delivery_date=None, due_date=None)
+
+    # 추정치는 휴리스틱이므로 부족하면 구간을 넓히고, 넓힐 때마다 예산을 다시 확인
+    span = estimate_cost(
+        DeliveryInfo(delivery_date=target_due_date, country_codes=country_codes),
+        term,
+        with_holidays=holiday_provider is not None,
+    ).walk_steps
+    calendar: Optional[BusinessCalendar] = None
+    expansions = 0
+    while True:
+        window_start = earliest_delivery_date or _shift_date(target_due_date, -span)
+        _check_window_budget(budget, window_start, latest_candidate, countries)
+        if calendar is None:
+            calendar = _build_calendar(
+                DeliveryInfo(delivery_date=target_due_date, country_codes=country_codes),
+                holiday_provider,
+                skip_weekends=term.skip_weekends,
+                skip_holidays=term.skip_holidays,
+            )
+        index = BusinessDayIndex(calendar, window_start, latest_candidate)
+
+        def due_date_of(delivery_date: date) -> Optional[date]:
+            return _due_date_in_index(
+                index, calendar, delivery_date, effective_days, term.adjust_to_weekday
+            )
+
+        def feasible(delivery_date: date) -> bool:
+            due_date = due_date_of(delivery_date)
+            return due_date is not None and due_date <= target_due_date
+
+        if feasible(window_start):
+            break
+        if (
+            earliest_delivery_date is not None
+            or window_start == date.min
+            or expansions >= MAX_WINDOW_EXPANSIONS
+        ):
+            return DeliveryWindow(window_start=window_start, latest_delivery_date=None, due_date=None)
+        # 추정 구간이 부족하면 두 배로 넓혀 다시 색인
+        span *= 2
+        expansions += 1
+
+    # feasible(low) == True 를 유지하며 마지막으로 가능한 배송일 탐색
+    low, high = window_start.toordinal(), latest_candidate.toordinal()
+    while low < high:
+        middle = (low + high + 1) // 2
+        if feasible(date.fromordinal(middle)):
+            low = middle
+        else:
+            high = middle - 1
+
+    latest_delivery_date = date.fromordinal(low)
+    return DeliveryWindow(
+        window_start=window_start,
+        latest_delivery_date=latest_delivery_date,
+        due_date=due_date_of(latest_delivery_date),
+    )
+
+
+def solve_max_days(
+    delivery: DeliveryInfo,
+    term: PaymentTerm,
+    target_due_date: date,
+    holiday_provider: Optional[HolidayProvider] = None,
+    budget: Optional[WorkBudget] = None,
+) -> DaysWindow:
+    """
+    지급기일이 목표일 이내가 되는 가장 큰 DDD 일수를 역산합니다.
+
+    지급기일은 일수에 대해 단조 증가하므로, 누적 영업일 색인 위에서 일수를 이분 탐색합니다.
+    term.days는 사용하지 않습니다.
+
+    Args:
+        delivery: 배송 정보
+        term: DDD 지급 조건 (옵션만 사용)
+        target_due_date: 목표 지급기일
+        holiday_provider: 공휴일 제공자 (옵션)
+        budget: 작업량 예산
+
+    Returns:
+        가능한 일수 범위 (min_days ~ max_days)
+
+    Raises:
+        BudgetExceededError: 색인 구간이 예산을 넘는 경우
+    """
+    if term.kind.upper() != "DDD":
+        raise ValueError("Inverse queries require a DDD term with 'days'")
+
+    index_end = _shift_date(max(target_due_date, delivery.delivery_date), ADJUST_LOOKAHEAD_DAYS)
+    countries = len(delivery.country_codes) if holiday_provider is not None else 0
+    _check_window_budget(budget, delivery.delivery_date, index_end, countries)
+
+    calendar = _build_calendar(
+        delivery,
+        holiday_provider,
+        skip_weekends=term.skip_weekends,
+        skip_holidays=term.skip_holidays,
+    )
+    index = BusinessDayIndex(calendar, delivery.delivery_date, index_end)
+
+    # 공급당일을 1DDD로 포함하면 1일이 가장 짧은 조건 (유효 일수 0)
+    min_days = 1 if term.include_delivery_as_day_one else 0
+
+    def due_date_of(days: int) -> Optional[date]:
+        return _due_date_in_index(
+            index, calendar, delivery.delivery_date, days - min_days, term.adjust_to_weekday
+        )
+
+    def feasible(days: int) -> bool:
+        due_date = due_date_of(days)
+        return due_date is not None and due_date <= target_due_date
+
+    if not feasible(min_days):
+        return DaysWindow(min_days=min_days, max_days=None, due_date=None)
+
+    # 색인 구간 안의 영업일 수를 넘는 일수는 지급기일이 구간 밖이므로 불가능
+    low = min_days
+    high = min_days + index.count_business_days(delivery.delivery_date, index_end)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if feasible(middle):
+            low = middle
+        else:
+            high = middle - 1
+
+    return DaysWindow(min_days=min_days, max_days=low, due_date=due_date_of(low))
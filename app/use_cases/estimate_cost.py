@@ -0,0 +1,118 @@
+import math
+from dataclasses import dataclass
+from datetime import date
+
+from app.domain.ddd.entities import DeliveryInfo, PaymentTerm
+
+
+# 국가·연도당 평일 공휴일 수의 경험적 추정치 (영업일 순회 길이 추정용, 상한이 아님)
+HOLIDAYS_PER_COUNTRY_YEAR = 20
+
+
+@dataclass(frozen=True)
+class CalculationCost:
+    """계산 전에 추정한 작업량"""
+    walk_steps: int  # 영업일 순회에서 지나갈 달력 일수
+    holiday_fetches: int  # 조회할 (국가, 연도) 공휴일 묶음 수
+    result_items: int  # 응답에 담길 제외 날짜 수
+
+    def __add__(self, other: "CalculationCost") -> "CalculationCost":
+        return CalculationCost(
+            walk_steps=self.walk_steps + other.walk_steps,
+            holiday_fetches=self.holiday_fetches + other.holiday_fetches,
+            result_items=self.result_items + other.result_items,
+        )
+
+
+ZERO_COST = CalculationCost(walk_steps=0, holiday_fetches=0, result_items=0)
+
+
+@dataclass(frozen=True)
+class WorkBudget:
+    """계산 도중 작업 범위를 늘리는 유스케이스에 넘기는 요청당 예산"""
+    walk_steps: int  # 달력 일수
+    holiday_fetches: int  # (국가, 연도) 공휴일 조회 수
+
+    def allows(self, cost: CalculationCost) -> bool:
+        return cost.walk_steps <= self.walk_steps and cost.holiday_fetches <= self.holiday_fetches
+
+
+class BudgetExceededError(ValueError):
+    """계산 도중 늘어난 작업 범위가 예산을 넘는 경우"""
+
+    def __init__(self, message: str, cost: CalculationCost):
+        super().__init__(message)
+        self.cost = cost
+
+
+def estimate_cost(
+    delivery: DeliveryInfo,
+    term: PaymentTerm,
+    with_holidays: bool = True,
+) -> CalculationCost:
+    """
+    calculate_due_date를 실행하기 전에 작업량을 추정합니다.
+
+    휴리스틱 추정치이므로 공휴일이 HOLIDAYS_PER_COUNTRY_YEAR보다 많은 국가에서는
+    실제 작업량이 더 클 수 있습니다. 추정 범위를 넘어 탐색을 늘리는 호출자는
+    늘린 범위를 다시 예산과 비교해야 합니다.
+
+    Args:
+        delivery: 배송 정보
+        term: 지급 조건
+        with_holidays: 공휴일 제공자 사용 여부
+
+    Returns:
+        추정 작업량 (순회 일수, 공휴일 조회 수, 결과 크기)
+    """
+    if term.kind.upper() != "DDD" or term.days is None:
+        return ZERO_COST
+
+    effective_days = term.days - 1 if term.include_delivery_as_day_one else term.days
+    effective_days = max(effective_days, 0)
+    countries = len(delivery.country_codes) if with_holidays else 0
+
+    # 주말 제외 시 영업일 5일마다 달력 7일
+    walk_steps = effective_days
+    if term.skip_weekends:
+        walk_steps = math.ceil(effective_days * 7 / 5) + 2
+
+    # 순회 기간 동안 지나칠 수 있는 공휴일만큼 연장
+    if term.skip_holidays and countries:
+        years_walked = walk_steps / 365 + 1
+        walk_steps += math.ceil(years_walked * HOLIDAYS_PER_COUNTRY_YEAR * countries)
+
+    # 배송일이 속한 연도부터 순회가 끝나는 연도까지 (결제일 조정으로 전년도가 필요할 수 있음)
+    start_ordinal = delivery.delivery_date.toordinal()
+    years_spanned = (start_ordinal + walk_steps) // 365 - start_ordinal // 365 + 2
+    holiday_fetches = years_spanned * countries
+
+    return CalculationCost(
+        walk_steps=walk_steps,
+        holiday_fetches=holiday_fetches,
+        result_items=walk_steps - effective_days,
+    )
+
+
+def estimate_range_cost(start: date, end: date, countries: int) -> CalculationCost:
+    """
+    [start, end] 구간 전체를 영업일 색인으로 만들 때의 작업량을 계산합니다.
+
+    Args:
+        start: 구간 시작일
+        end: 구간 종료일
+        countries: 공휴일을 조회할 국가 수 (공휴일 제공자가 없으면 0)
+
+    Returns:
+        작업량 (구간 달력 일수, 구간에 걸친 (국가, 연도) 조회 수)
+    """
+    return CalculationCost(
+        walk_steps=end.toordinal() - start.toordinal() + 1,
+        holiday_fetches=(end.year - start.year + 1) * countries,
+        result_items=0,
+    )
+
+
+def exceeds_calendar_range(delivery: DeliveryInfo, cost: CalculationCost) -> bool:
+    """추정 순회가 지원하는 날짜 범위(9999-12-31)를 넘어가는지 확인합니다."""
+    return delivery.delivery_date.toordinal() + cost.walk_steps > date.max.toordinal()
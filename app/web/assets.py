@@ -0,0 +1,136 @@
+import gzip
+import hashlib
+import json
+import shutil
+import stat
+from functools import lru_cache
+from pathlib import Path
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+from app.web.http import accepts_encoding
+
+
+STATIC_DIR = Path("app/static")
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# 핑거프린트된 자산은 내용이 바뀌면 URL이 바뀌므로 영구 캐시 가능
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 빌드 대상 원본 자산
+SOURCE_ASSETS = ("app.js", "style.css")
+
+# 미리 압축된 파일 (선호 순서)
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _minify(name: str, source: str) -> str:
+    """확장자에 맞는 압축기로 공백/주석을 제거합니다."""
+    if name.endswith(".js"):
+        import rjsmin
+
+        return rjsmin.jsmin(source)
+    if name.endswith(".css"):
+        import rcssmin
+
+        return rcssmin.cssmin(source)
+    return source
+
+
+def build_assets(static_dir: Path = STATIC_DIR) -> dict[str, str]:
+    """
+    정적 자산을 빌드합니다: 압축(minify) → 내용 해시로 핑거프린트 → gzip/brotli 사전 압축.
+
+    결과는 `<static_dir>/dist/`에 저장되고, 원본 이름 -> 빌드된 경로 매핑을
+    `dist/manifest.json`에 기록합니다.
+
+    Args:
+        static_dir: 정적 자산 디렉토리
+
+    Returns:
+        원본 이름 -> `/static` 기준 상대 경로 매핑
+    """
+    import brotli
+
+    dist_dir = static_dir / DIST_DIRNAME
+    if dist_dir.exists():
+        shutil.rmtree(dist_dir)
+    dist_dir.mkdir(parents=True)
+
+    manifest: dict[str, str] = {}
+    for name in SOURCE_ASSETS:
+        source = (static_dir / name).read_text(encoding="utf-8")
+        content = _minify(name, source).encode("utf-8")
+
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        stem, _, suffix = name.rpartition(".")
+        built_name = f"{stem}.{digest}.{suffix}"
+
+        built_path = dist_dir / built_name
+        built_path.write_bytes(content)
+        (dist_dir / (built_name + ".gz")).write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+        (dist_dir / (built_name + ".br")).write_bytes(brotli.compress(content, quality=11))
+
+        manifest[name] = f"{DIST_DIRNAME}/{built_name}"
+
+    (dist_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    get_manifest.cache_clear()
+    return manifest
+
+
+@lru_cache
+def get_manifest() -> dict[str, str]:
+    """빌드 매니페스트를 읽습니다. 빌드하지 않은 경우(개발 환경) 빈 매핑을 반환합니다."""
+    manifest_path = STATIC_DIR / DIST_DIRNAME / MANIFEST_NAME
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def static_url(name: str) -> str:
+    """정적 자산 URL을 반환합니다 (빌드된 경우 핑거프린트된 경로)."""
+    return f"/static/{get_manifest().get(name, name)}"
+
+
+class AssetStaticFiles(StaticFiles):
+    """
+    빌드된 자산(`dist/`)에 대해 미리 압축된 파일과 영구 캐시 헤더를 제공하는 StaticFiles
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not path.startswith(f"{DIST_DIRNAME}/"):
+            return await super().get_response(path, scope)
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        response = None
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if not accepts_encoding(accept_encoding, encoding):
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+                # 원본 파일의 미디어 타입을 유지
+                response.headers["content-type"] = self._media_type(path)
+                response.headers["content-encoding"] = encoding
+                break
+
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["vary"] = "Accept-Encoding"
+        return response
+
+    @staticmethod
+    def _media_type(path: str) -> str:
+        if path.endswith(".js"):
+            return "text/javascript; charset=utf-8"
+        if path.endswith(".css"):
+            return "text/css; charset=utf-8"
+        return "application/octet-stream"
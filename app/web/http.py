@@ -0,0 +1,47 @@
+from typing import Optional
+
+
+def _quality(params: list[str]) -> float:
+    """헤더 항목의 매개변수에서 품질값(q)을 읽습니다 (없으면 1.0)."""
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepts_encoding(accept_encoding: Optional[str], encoding: str) -> bool:
+    """
+    Accept-Encoding 헤더가 해당 인코딩을 허용하는지 확인합니다 (RFC 9110 12.5.3).
+
+    명시한 인코딩의 품질값이 0이면 거부로 보고, 명시하지 않은 인코딩은 `*`의 품질값을 따릅니다.
+    """
+    if not accept_encoding:
+        return False
+
+    wildcard: Optional[float] = None
+    for part in accept_encoding.split(","):
+        coding, *params = [token.strip() for token in part.split(";")]
+        coding = coding.lower()
+        if coding == encoding:
+            return _quality(params) > 0
+        if coding == "*":
+            wildcard = _quality(params)
+    return wildcard is not None and wildcard > 0
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 약한 비교로 확인합니다 (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(opaque(candidate) == opaque(etag) for candidate in if_none_match.split(","))
@@ -1,14 +1,50 @@
+import gzip
+import hashlib
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
+from app.core.config import get_settings
 from app.core.i18n import detect_language, get_translations
+from app.web.assets import static_url
+from app.web.http import accepts_encoding, etag_matches
 
 
 router = APIRouter(include_in_schema=False)
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_url"] = static_url
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """미리 렌더링된 페이지"""
+    body: bytes  # 렌더링된 HTML (UTF-8)
+    gzip_body: bytes  # gzip 압축된 HTML
+    etag: str  # 내용 기반 ETag
+
+
+@lru_cache(maxsize=64)
+def render_index(lang: str, current_year: int, canonical_url: str) -> RenderedPage:
+    """
+    인덱스 페이지를 언어/연도/정규 URL별로 한 번만 렌더링하여 캐시합니다.
+
+    정규 URL은 설정값(PUBLIC_BASE_URL)이므로 클라이언트가 캐시 키를 늘릴 수 없습니다.
+    """
+    html = templates.get_template("index.html").render(
+        t=get_translations(lang),
+        current_year=current_year,
+        canonical_url=canonical_url,
+    )
+    body = html.encode("utf-8")
+    return RenderedPage(
+        body=body,
+        gzip_body=gzip.compress(body, mtime=0),
+        etag=f'W/"{hashlib.sha256(body).hexdigest()[:16]}"',
+    )
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -17,9 +53,20 @@ def index(request: Request):
     # Detect language from Accept-Language header
     accept_language = request.headers.get("accept-language")
     lang = detect_language(accept_language)
-    t = get_translations(lang)
 
-    return templates.TemplateResponse(
-        "index.html",
-        {"request": request, "t": t, "current_year": datetime.now().year},
-    )
+    # Host 헤더는 클라이언트가 정하므로 정규 URL은 설정에서만 가져옴 (비어 있으면 태그 생략)
+    canonical_url = get_settings().public_base_url
+    page = render_index(lang, datetime.now().year, canonical_url)
+
+    headers = {
+        "ETag": page.etag,
+        "Cache-Control": "no-cache",
+        "Content-Language": lang,
+        "Vary": "Accept-Language, Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), page.etag):
+        return Response(status_code=304, headers=headers)
+
+    if accepts_encoding(request.headers.get("accept-encoding"), "gzip"):
+        return HTMLResponse(page.gzip_body, headers={**headers, "Content-Encoding": "gzip"})
+    return HTMLResponse(page.body, headers=headers)